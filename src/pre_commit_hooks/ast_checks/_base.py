@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import ast
 import io
 import logging
 import os
@@ -16,6 +15,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     import argparse
+    import ast
 
 logger = logging.getLogger("ast_checks")
 
@@ -216,33 +216,32 @@ def normalize_for_tokenize(source: str) -> str:
     return _LONE_CR_PATTERN.sub("\n", source)
 
 
-def fast_get_source_segment(source: str, ast_lines: list[str], node: ast.expr) -> str | None:
-    """Equivalent to `ast.get_source_segment(source, node)` for a
-    single-line node, without that stdlib function's own per-call cost.
+def fast_get_source_segment(ast_lines: list[str], node: ast.expr) -> str | None:
+    """Equivalent to `ast.get_source_segment(source, node)`, without that
+    stdlib function's own per-call cost.
 
-    `ast.get_source_segment()` re-splits the *entire* `source` into lines
-    on every call (see its implementation), which is fine for a handful of
-    calls but turns a hot per-node loop — one call per assignment, across
-    every assignment in a file — into O(nodes x source size) instead of
+    `ast.get_source_segment()` re-splits `source` into lines on every call
+    (see its implementation), which is fine for a handful of calls but
+    turns a hot per-node loop — one call per assignment, across every
+    assignment in a file — into O(nodes x source size) instead of
     O(source size) overall. `ast_lines` is computed once by the caller via
-    `split_lines_like_ast()` and reused across every call.
-
-    Falls back to the real `ast.get_source_segment` for a node spanning
-    multiple lines: reconstructing a multi-line segment correctly needs
-    each line's own newline still attached (which `split_lines_like_ast`'s
-    lines already have, but the fallback is simplest — rare enough among
-    the assignment/call RHS expressions this is used for that the fast
-    path not covering it doesn't matter).
+    `split_lines_like_ast()` and reused across every call; each line keeps
+    its own terminator, so a node spanning several lines is stitched back
+    together from the same list, exactly as the stdlib function does from
+    its own split.
 
     Returns None if `node` is missing end-position info, mirroring
     `ast.get_source_segment`'s own contract.
     """
     if node.end_lineno is None or node.end_col_offset is None:
         return None
-    if node.end_lineno != node.lineno:
-        return ast.get_source_segment(source, node)
-    line = ast_lines[node.lineno - 1]
-    return line.encode()[node.col_offset : node.end_col_offset].decode()
+    first_idx = node.lineno - 1
+    last_idx = node.end_lineno - 1
+    if first_idx == last_idx:
+        return ast_lines[first_idx].encode()[node.col_offset : node.end_col_offset].decode()
+    first = ast_lines[first_idx].encode()[node.col_offset :].decode()
+    last = ast_lines[last_idx].encode()[: node.end_col_offset].decode()
+    return first + "".join(ast_lines[first_idx + 1 : last_idx]) + last
 
 
 def read_source_with_encoding(filepath: Path) -> tuple[str, str]:
@@ -352,10 +351,17 @@ def find_ignored_lines(source: str, pattern: re.Pattern[str]) -> set[int]:
 
     Uses the tokenize module to accurately detect comments, so a string or
     byte literal that happens to contain matching text (e.g. a dict key)
-    is never mistaken for a suppression directive.
+    is never mistaken for a suppression directive. `pattern` must be
+    unanchored, like `ignore_pattern_for()`'s.
     """
     ignored: set[int] = set()
 
+    # Every COMMENT token's text is a slice of `source`, so if the pattern
+    # matches nowhere in the raw text there is nothing to tokenize for —
+    # the common case, since most files carry no suppression at all.
+    if pattern.search(source) is None:
+        return ignored
+
     try:
         tokens = tokenize.generate_tokens(io.StringIO(normalize_for_tokenize(source)).readline)
 
@@ -6,12 +6,12 @@ import ast
 import bisect
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pre_commit_hooks.ast_checks._base import classify_comment_lines, fast_get_source_segment, split_lines_like_ast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
 type UsageContext = Literal["attribute_or_subscript_assignment", "augmented_assignment", "unknown"]
 
@@ -124,16 +124,7 @@ def _unwind_to_base_name(node: ast.expr) -> ast.Name | None:
 
 
 def _has_await_expression(node: ast.expr) -> bool:
-    class AwaitDetector(ast.NodeVisitor):
-        def __init__(self) -> None:
-            self.has_await = False
-
-        def visit_Await(self, _node: ast.Await) -> None:
-            self.has_await = True
-
-    detector = AwaitDetector()
-    detector.visit(node)
-    return detector.has_await
+    return any(isinstance(child, ast.Await) for child in ast.walk(node))
 
 
 # Node types treated as "may run arbitrary user code, or suspend execution"
@@ -299,7 +290,6 @@ class VariableTracker(ast.NodeVisitor):
     """Builds a map of variable lifecycles: where each variable is assigned and where it's used, across scopes."""
 
     def __init__(self, source: str) -> None:
-        self.source = source
         self.source_lines = source.splitlines()
         # For _get_source_segment only: split on the same line boundaries
         # ast's own lineno/end_lineno use, unlike self.source_lines above
@@ -338,6 +328,11 @@ class VariableTracker(ast.NodeVisitor):
         # lambda is defined.
         self.lambda_depth = 0
 
+        # Counted like the depths above rather than searched for in
+        # parent_stack, so visit_Name stays O(1) however deeply it's nested.
+        self.await_depth = 0
+        self.fstring_expression_depth = 0
+
         self.parent_stack: list[ast.AST] = []
 
         # Innermost enclosing statement of whatever node is currently being
@@ -349,6 +344,9 @@ class VariableTracker(ast.NodeVisitor):
         # child_scope_id -> parent_scope_id, for closure detection.
         self.scope_parents: dict[int, int] = {}
 
+        # node type -> bound visit_*/generic_visit handler, see visit().
+        self._handlers: dict[type[ast.AST], Callable[[Any], None]] = {}
+
     def _enter_scope(self) -> None:
         parent_scope_id = self._get_current_scope_id()
         self.current_scope_id += 1
@@ -393,7 +391,7 @@ class VariableTracker(ast.NodeVisitor):
         instead of O(assignments x source size).
         """
         try:
-            return fast_get_source_segment(self.source, self._ast_lines, node) or ""
+            return fast_get_source_segment(self._ast_lines, node) or ""
         # Defensive: fast_get_source_segment slices source by byte offset
         # and decodes it, which could raise (ValueError/UnicodeDecodeError,
         # or TypeError) if a node's position were ever inconsistent with
@@ -402,6 +400,12 @@ class VariableTracker(ast.NodeVisitor):
         except ValueError, TypeError:  # pragma: no cover
             return ""
 
+    def _is_global_or_nonlocal(self, scope_id: int, var_name: str) -> bool:
+        # Two lookups rather than `in self.global_vars | self.nonlocal_vars`,
+        # which would copy both sets on every assignment.
+        key = (scope_id, var_name)
+        return key in self.global_vars or key in self.nonlocal_vars
+
     def _is_simple_name_target(self, target: ast.expr) -> bool:
         return isinstance(target, ast.Name)
 
@@ -537,7 +541,14 @@ class VariableTracker(ast.NodeVisitor):
 
     def visit_Await(self, node: ast.Await) -> None:
         self._record_suspension_point(node.lineno, node.col_offset)
+        self.await_depth += 1
+        self.generic_visit(node)
+        self.await_depth -= 1
+
+    def visit_FormattedValue(self, node: ast.FormattedValue) -> None:
+        self.fstring_expression_depth += 1
         self.generic_visit(node)
+        self.fstring_expression_depth -= 1
 
     def _record_suspension_point(self, line: int, col: int) -> None:
         scope_id = self._get_current_scope_id()
@@ -601,7 +612,7 @@ class VariableTracker(ast.NodeVisitor):
                 assert isinstance(target, ast.Name)  # Type narrowing
                 var_name = target.id
 
-                if (scope_id, var_name) in self.global_vars | self.nonlocal_vars:
+                if self._is_global_or_nonlocal(scope_id, var_name):
                     continue
 
                 self.currently_assigning.add(var_name)
@@ -650,7 +661,7 @@ class VariableTracker(ast.NodeVisitor):
 
         if isinstance(target, ast.Name):
             var_name = target.id
-            if (scope_id, var_name) in self.global_vars | self.nonlocal_vars:
+            if self._is_global_or_nonlocal(scope_id, var_name):
                 return
             marker = AssignmentInfo(
                 var_name=var_name,
@@ -686,7 +697,7 @@ class VariableTracker(ast.NodeVisitor):
         if base is not None:
             var_name = base.id
 
-            if (scope_id, var_name) in self.global_vars | self.nonlocal_vars:
+            if self._is_global_or_nonlocal(scope_id, var_name):
                 return
 
             usage = UsageInfo(
@@ -715,7 +726,7 @@ class VariableTracker(ast.NodeVisitor):
             assert isinstance(node.target, ast.Name)  # Type narrowing
             var_name = node.target.id
 
-            if (scope_id, var_name) in self.global_vars | self.nonlocal_vars:
+            if self._is_global_or_nonlocal(scope_id, var_name):
                 return
 
             self.currently_assigning.add(var_name)
@@ -766,7 +777,7 @@ class VariableTracker(ast.NodeVisitor):
             assert isinstance(node.target, ast.Name)  # Type narrowing
             var_name = node.target.id
 
-            if (scope_id, var_name) in self.global_vars | self.nonlocal_vars:
+            if self._is_global_or_nonlocal(scope_id, var_name):
                 self.generic_visit(node)
                 return
 
@@ -800,7 +811,7 @@ class VariableTracker(ast.NodeVisitor):
         stmt_index = self._get_current_stmt_index()
         var_name = node.target.id
 
-        if (scope_id, var_name) in self.global_vars | self.nonlocal_vars:
+        if self._is_global_or_nonlocal(scope_id, var_name):
             return
 
         self._track_rebinding_use(var_name, node.target.lineno, node.target.col_offset, scope_id, stmt_index)
@@ -835,10 +846,18 @@ class VariableTracker(ast.NodeVisitor):
         reconstruct "the enclosing statement" for an arbitrary node. This
         override catches every ast.stmt as it's dispatched, regardless of
         which visit_* method (or none) handles it next.
+
+        Also replaces NodeVisitor.visit's per-node "visit_" + class-name
+        string build and getattr() with one lookup per node type.
         """
         if isinstance(node, ast.stmt):
             self.current_stmt = node
-        super().visit(node)
+        node_type = type(node)
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            handler = getattr(self, "visit_" + node_type.__name__, self.generic_visit)
+            self._handlers[node_type] = handler
+        handler(node)
 
     def generic_visit(self, node: ast.AST) -> None:
         self.parent_stack.append(node)
@@ -858,9 +877,6 @@ class VariableTracker(ast.NodeVisitor):
         scope_id = self._get_current_scope_id()
         stmt_index = self._get_current_stmt_index()
 
-        usage_has_await = any(isinstance(parent, ast.Await) for parent in self.parent_stack)
-        in_fstring_expression = any(isinstance(parent, ast.FormattedValue) for parent in self.parent_stack)
-
         fstring_field_span: tuple[int, int] | None = None
         immediate_parent = self.parent_stack[-1] if self.parent_stack else None
         if (
@@ -886,14 +902,14 @@ class VariableTracker(ast.NodeVisitor):
             stmt_index=stmt_index,
             context=context,
             scope_id=scope_id,
-            usage_has_await=usage_has_await,
+            usage_has_await=self.await_depth > 0,
             in_control_flow=self.control_flow_depth > 0,
             in_loop=self.loop_depth > 0,
             in_lambda=self.lambda_depth > 0,
             in_comprehension=self.comprehension_depth > 0,
             node=node,
             enclosing_stmt=self.current_stmt,
-            in_fstring_expression=in_fstring_expression,
+            in_fstring_expression=self.fstring_expression_depth > 0,
             fstring_field_span=fstring_field_span,
         )
 
@@ -904,6 +920,9 @@ class VariableTracker(ast.NodeVisitor):
 
     def build_lifecycles(self) -> list[VariableLifecycle]:
         lifecycles: list[VariableLifecycle] = []
+        # Scope nesting is final once visiting is done, so each scope's
+        # descendants are collected once rather than per assignment.
+        child_scopes_by_scope: dict[int, list[int]] = {}
 
         for (scope_id, var_name), assignment_list in self.assignments.items():
             for assignment in assignment_list:
@@ -912,7 +931,9 @@ class VariableTracker(ast.NodeVisitor):
                 relevant_uses = [use for use in all_uses if use.stmt_index >= assignment.stmt_index]
 
                 # Variables captured by closures should not be marked as redundant.
-                child_scopes = self._get_child_scopes(scope_id)
+                child_scopes = child_scopes_by_scope.get(scope_id)
+                if child_scopes is None:
+                    child_scopes = child_scopes_by_scope[scope_id] = self._get_child_scopes(scope_id)
 
                 # A child scope's `nonlocal` declaration means the closure
                 # captures and potentially modifies this variable, so the
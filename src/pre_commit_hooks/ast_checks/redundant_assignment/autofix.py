@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import logging
 import re
 from typing import TYPE_CHECKING, TypedDict, cast
@@ -19,7 +20,7 @@ logger = logging.getLogger("redundant_assignment")
 
 class RedundantAssignmentFixData(TypedDict):
     """Constructed by RedundantAssignmentCheck.check(), read back here by
-    apply_fixes(). Must stay JSON-serializable (no AST nodes/lifecycle
+    fix_source(). Must stay JSON-serializable (no AST nodes/lifecycle
     objects) — detect_redundancy() only returns a pattern for single-use
     lifecycles, so use_line/use_col are always concrete ints, never absent.
     """
@@ -38,12 +39,47 @@ class RedundantAssignmentFixData(TypedDict):
     fstring_field_end_col: int | None
 
 
+@functools.lru_cache(maxsize=1024)
+def _word_boundary_pattern(var_name: str) -> re.Pattern[str]:
+    # Word boundaries so 'x' doesn't match inside 'max' or 'index'.
+    return re.compile(r"\b" + re.escape(var_name) + r"\b")
+
+
 def apply_fixes(
     filepath: Path,
     violations: list[Violation],
     source: str,
     encoding: str = "utf-8",
 ) -> bool:
+    """Writes `fix_source()`'s result back to `filepath`. Returns True only if
+    at least one violation was fixed and the write succeeded.
+    """
+    new_source, applied_violations = fix_source(violations, source, encoding)
+
+    if not applied_violations:
+        return False
+
+    try:
+        atomic_write_text(filepath, new_source, encoding)
+    except OSError:
+        # Debug-only: mark_fix_failed() below already reports this
+        # cleanly as [FIX FAILED] — an ERROR-level .exception() call
+        # here would just leak a redundant raw traceback onto the
+        # user's stderr by default (nothing in this codebase configures
+        # logging, so Python's own lastResort handler prints WARNING+
+        # straight to stderr).
+        logger.debug("Failed to write %s", filepath, exc_info=True)
+        for v in applied_violations:
+            mark_fix_failed(v)
+        return False
+    return True
+
+
+def fix_source(
+    violations: list[Violation],
+    source: str,
+    encoding: str = "utf-8",
+) -> tuple[str, list[Violation]]:
     """A VERY conservative implementation that only fixes violations marked as
     fixable by strict semantic analysis. It only handles the simplest cases:
     - Not in loops or control flow
@@ -51,11 +87,14 @@ def apply_fixes(
     - Simple RHS (constants, names, single-level attributes)
     - Short variable names
     - Very low semantic value
+
+    Returns the fixed source and the violations actually applied to it
+    (`source` itself and an empty list when nothing could be fixed).
     """
     fixable_violations = [v for v in violations if v.fixable]
 
     if not fixable_violations:
-        return False
+        return source, []
 
     source_lines = source.splitlines(keepends=True)
 
@@ -73,7 +112,6 @@ def apply_fixes(
 
     fixable_violations.sort(key=_use_position, reverse=True)
 
-    fixed_any = False
     applied_violations: list[Violation] = []
     removed_lines: set[int] = set()
 
@@ -125,7 +163,6 @@ def apply_fixes(
                 continue
             source_lines[assign_line_idx] = ""
             removed_lines.add(assign_line_idx)
-            fixed_any = True
             applied_violations.append(violation)
             continue
 
@@ -134,10 +171,7 @@ def apply_fixes(
 
         use_line = source_lines[use_line_idx]
 
-        # Word boundaries so 'x' doesn't match inside 'max' or 'index'.
-        pattern = r"\b" + re.escape(var_name) + r"\b"
-
-        matches = tuple(re.finditer(pattern, use_line))
+        matches = tuple(_word_boundary_pattern(var_name).finditer(use_line))
 
         # use_col is a UTF-8 byte offset (from ast.col_offset); match.start()
         # is a character offset, so convert before comparing.
@@ -162,29 +196,13 @@ def apply_fixes(
         source_lines[assign_line_idx] = ""
         removed_lines.add(assign_line_idx)
 
-        fixed_any = True
         applied_violations.append(violation)
 
-    if fixed_any:
-        _cleanup_blank_lines_around_removals(source_lines, removed_lines)
-
-        new_source = "".join(source_lines)
-        try:
-            atomic_write_text(filepath, new_source, encoding)
-        except OSError:
-            # Debug-only: mark_fix_failed() below already reports this
-            # cleanly as [FIX FAILED] — an ERROR-level .exception() call
-            # here would just leak a redundant raw traceback onto the
-            # user's stderr by default (nothing in this codebase configures
-            # logging, so Python's own lastResort handler prints WARNING+
-            # straight to stderr).
-            logger.debug("Failed to write %s", filepath, exc_info=True)
-            for v in applied_violations:
-                mark_fix_failed(v)
-            return False
-        return True
+    if not applied_violations:
+        return source, []
 
-    return False
+    _cleanup_blank_lines_around_removals(source_lines, removed_lines)
+    return "".join(source_lines), applied_violations
 
 
 def _cleanup_blank_lines_around_removals(source_lines: list[str], removed_lines: set[int]) -> None:
@@ -242,7 +260,7 @@ def _try_literal_eval_str(rhs_source: str) -> str | None:
     (see semantic.is_safe_to_splice_into_fstring) — the caller must treat
     "is a string literal" and "is safe to splice" as separate questions:
     once RHS is confirmed a string literal, the splice is the *only*
-    correct fix (see apply_fixes), so an unsafe one must be declined
+    correct fix (see fix_source), so an unsafe one must be declined
     outright, not silently swapped for the generic (buggy, re-quoting)
     path used for non-string RHS types.
     """
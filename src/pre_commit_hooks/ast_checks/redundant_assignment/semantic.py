@@ -116,22 +116,8 @@ def _count_chained_operations(node: ast.expr) -> int:
     return count
 
 
-def _adds_verbosity_or_context(var_name: str, rhs_source: str, rhs_node: ast.expr) -> bool:
-    """True when the variable name provides more descriptive or domain-specific
-    information than the RHS expression conveys on its own.
-
-    Examples that add verbosity/context:
-        raw_headers = kwargs.get("headers")  # "raw_" prefix adds meaning
-        translations = orjson.loads(f.read())  # describes what data is
-        firestore_client = db.client()  # more specific than "client"
-        user_email = data["email"]  # more verbose than just "email"
-    """
-    var_lower = var_name.lower()
-    rhs_lower = rhs_source.lower()
-
-    # Pattern 1: Variable has descriptive prefix not in RHS
-    # Examples: raw_headers, parsed_data, validated_input
-    descriptive_word_prefixes = {
+_DESCRIPTIVE_WORD_PREFIXES = frozenset(
+    {
         "raw",
         "parsed",
         "validated",
@@ -159,11 +145,45 @@ def _adds_verbosity_or_context(var_name: str, rhs_source: str, rhs_node: ast.exp
         "modified",
         "updated",
     }
+)
+
+_GENERIC_PARSE_FUNCTIONS = frozenset(
+    {
+        "loads",
+        "load",
+        "parse",
+        "decode",
+        "deserialize",
+        "from_json",
+        "from_yaml",
+        "from_xml",
+        "read",
+        "read_text",
+    }
+)
 
+_GENERIC_PARSED_NAMES = frozenset({"data", "result", "value", "output", "obj", "dict"})
+
+
+def _adds_verbosity_or_context(var_name: str, rhs_source: str, rhs_node: ast.expr) -> bool:
+    """True when the variable name provides more descriptive or domain-specific
+    information than the RHS expression conveys on its own.
+
+    Examples that add verbosity/context:
+        raw_headers = kwargs.get("headers")  # "raw_" prefix adds meaning
+        translations = orjson.loads(f.read())  # describes what data is
+        firestore_client = db.client()  # more specific than "client"
+        user_email = data["email"]  # more verbose than just "email"
+    """
+    var_lower = var_name.lower()
+    rhs_lower = rhs_source.lower()
+
+    # Pattern 1: Variable has descriptive prefix not in RHS
+    # Examples: raw_headers, parsed_data, validated_input
     var_parts = var_name.split("_")
     if len(var_parts) >= 2:
         first_part = var_parts[0].lower()
-        if first_part in descriptive_word_prefixes and first_part not in rhs_lower:
+        if first_part in _DESCRIPTIVE_WORD_PREFIXES and first_part not in rhs_lower:
             return True
 
     # Pattern 2: Variable name is more verbose/explicit than dict/kwargs access
@@ -208,18 +228,6 @@ def _adds_verbosity_or_context(var_name: str, rhs_source: str, rhs_node: ast.exp
     # The variable name describes WHAT the data is (domain/semantics)
     # while the RHS just shows HOW it's loaded (generic operation)
     if isinstance(rhs_node, ast.Call):
-        generic_parse_functions = {
-            "loads",
-            "load",
-            "parse",
-            "decode",
-            "deserialize",
-            "from_json",
-            "from_yaml",
-            "from_xml",
-            "read",
-            "read_text",
-        }
         func_name = None
         if isinstance(rhs_node.func, ast.Attribute):
             func_name = rhs_node.func.attr.lower()
@@ -228,17 +236,51 @@ def _adds_verbosity_or_context(var_name: str, rhs_source: str, rhs_node: ast.exp
 
         # If it's a generic parse function and variable name is multi-part or long,
         # and not a generic placeholder name like "data" or "result"
-        generic_names = {"data", "result", "value", "output", "obj", "dict"}
         if (
-            func_name in generic_parse_functions
+            func_name in _GENERIC_PARSE_FUNCTIONS
             and (len(var_parts) >= 2 or len(var_name) >= 8)
-            and var_lower not in generic_names
+            and var_lower not in _GENERIC_PARSED_NAMES
         ):
             return True
 
     return False
 
 
+_TEST_SEMANTIC_WORDS = frozenset(
+    {
+        "mock",
+        "fake",
+        "sample",
+        "expected",
+        "actual",
+        "result",
+        "fixture",
+        "data",
+        "template",
+        "response",
+        "request",
+        "some",
+        "example",
+        "test",
+    }
+)
+
+_TEST_ASSERTION_RESULT_NAMES = frozenset({"result", "output", "value", "response", "landmark"})
+
+# Score added for the RHS's own node type. These AST classes have no
+# subclasses, so an exact `type()` lookup matches what `isinstance` would.
+_SCORE_BY_RHS_TYPE: dict[type[ast.expr], int] = {
+    ast.ListComp: 30,
+    ast.DictComp: 30,
+    ast.SetComp: 30,
+    ast.GeneratorExp: 30,
+    ast.BinOp: 15,
+    ast.UnaryOp: 10,
+    ast.IfExp: 20,
+    ast.Lambda: 25,
+}
+
+
 def calculate_semantic_value(
     var_name: str,
     rhs_source: str,
@@ -254,43 +296,22 @@ def calculate_semantic_value(
     - 50-100: Clear value (skip entirely)
     """
     score = 0
+    var_lower = var_name.lower()
+    name_parts = var_name.split("_")
 
     # Test code benefits more from named intermediate variables for clarity,
     # so apply a higher semantic value to descriptive variables here.
     if is_test_context or (filepath and _is_test_file(filepath)):
-        if len(var_name.split("_")) >= 2:
+        if len(name_parts) >= 2:
             # e.g. "camel_case_sample", "duffel_route", "mock_image"
             score += 30
 
-        test_semantic_words = {
-            "mock",
-            "fake",
-            "sample",
-            "expected",
-            "actual",
-            "result",
-            "fixture",
-            "data",
-            "template",
-            "response",
-            "request",
-            "some",
-            "example",
-            "test",
-        }
-        var_lower = var_name.lower()
-        if any(word in var_lower for word in test_semantic_words):
+        if any(word in var_lower for word in _TEST_SEMANTIC_WORDS):
             score += 25
 
         # A common pattern for making assertions clearer.
         # Example: result = landmark.__eq__(None); assert result is NotImplemented  # noqa: ERA001
-        if isinstance(rhs_node, ast.Call) and var_lower in {
-            "result",
-            "output",
-            "value",
-            "response",
-            "landmark",
-        }:
+        if isinstance(rhs_node, ast.Call) and var_lower in _TEST_ASSERTION_RESULT_NAMES:
             score += 30
 
         # Example: some_european_airports = ["AES", "BYJ", "BTS"]  # noqa: ERA001
@@ -305,7 +326,6 @@ def calculate_semantic_value(
     if _adds_verbosity_or_context(var_name, rhs_source, rhs_node):
         score += 50
 
-    var_lower = var_name.lower()
     if any(verb in var_lower for verb in TRANSFORMATIVE_VERBS):
         score += 60
 
@@ -315,16 +335,7 @@ def calculate_semantic_value(
     if any(var_lower.endswith(suffix) for suffix in DESCRIPTIVE_SUFFIXES):
         score += 40
 
-    if isinstance(rhs_node, ast.ListComp | ast.DictComp | ast.SetComp | ast.GeneratorExp):
-        score += 30
-    elif isinstance(rhs_node, ast.BinOp):
-        score += 15
-    elif isinstance(rhs_node, ast.UnaryOp):
-        score += 10
-    elif isinstance(rhs_node, ast.IfExp):
-        score += 20
-    elif isinstance(rhs_node, ast.Lambda):
-        score += 25
+    score += _SCORE_BY_RHS_TYPE.get(type(rhs_node), 0)
 
     chain_count = _count_chained_operations(rhs_node)
     if chain_count >= 3:
@@ -339,7 +350,6 @@ def calculate_semantic_value(
     elif len(rhs_source) > 40:
         score += 10
 
-    name_parts = var_name.split("_")
     if len(name_parts) >= 3:
         score += 20
     elif len(name_parts) == 2:
@@ -395,7 +405,7 @@ def exceeds_line_length_when_inlined(
 
     This is the exact check (given the real usage line) shared by
     `should_autofix` (deciding whether to report `[FIXABLE]`) and
-    `autofix.apply_fixes`'s `_can_safely_inline` (deciding whether to actually
+    `autofix.fix_source`'s `_can_safely_inline` (deciding whether to actually
     apply the fix). Both must agree, or a violation can be reported fixable
     and then silently skipped by `--fix`.
     """
@@ -428,13 +438,9 @@ def _would_require_parentheses(rhs_node: ast.expr) -> bool:
     return isinstance(rhs_node, ast.Compare)
 
 
-def _contains_nondeterministic_call(node: ast.expr) -> bool:
-    """Non-deterministic functions (time-related, random, UUID, etc.) return
-    different values on each call, so inlining them can change program
-    semantics.
-    """
-    # Known non-deterministic function/method names
-    nondeterministic_names = {
+# Known non-deterministic function/method names.
+_NONDETERMINISTIC_CALL_NAMES = frozenset(
+    {
         # time module functions
         "time",
         "perf_counter",
@@ -466,27 +472,29 @@ def _contains_nondeterministic_call(node: ast.expr) -> bool:
         "getpid",
         "getppid",
     }
+)
 
-    class NonDeterministicCallDetector(ast.NodeVisitor):
-        def __init__(self) -> None:
-            self.has_nondeterministic_call = False
-
-        def visit_Call(self, node: ast.Call) -> None:
-            func_name = ""
-            if isinstance(node.func, ast.Name):
-                func_name = node.func.id
-            elif isinstance(node.func, ast.Attribute):
-                func_name = node.func.attr
 
-            if func_name.lower() in nondeterministic_names:
-                self.has_nondeterministic_call = True
-                return
+def _contains_nondeterministic_call(node: ast.expr) -> bool:
+    """Non-deterministic functions (time-related, random, UUID, etc.) return
+    different values on each call, so inlining them can change program
+    semantics.
+    """
+    for child in ast.walk(node):
+        if not isinstance(child, ast.Call):
+            continue
+        if isinstance(child.func, ast.Name):
+            func_name = child.func.id
+        elif isinstance(child.func, ast.Attribute):
+            func_name = child.func.attr
+        else:
+            continue
+        if func_name.lower() in _NONDETERMINISTIC_CALL_NAMES:
+            return True
+    return False
 
-            self.generic_visit(node)
 
-    detector = NonDeterministicCallDetector()
-    detector.visit(node)
-    return detector.has_nondeterministic_call
+_GENERIC_CONSTANT_NAMES = frozenset({"value", "val", "num", "number", "count", "total", "result", "temp"})
 
 
 def _is_named_constant_pattern(var_name: str, rhs_node: ast.expr) -> bool:
@@ -505,17 +513,7 @@ def _is_named_constant_pattern(var_name: str, rhs_node: ast.expr) -> bool:
     if len(var_name.split("_")) >= 2:
         return True
 
-    generic_names = {
-        "value",
-        "val",
-        "num",
-        "number",
-        "count",
-        "total",
-        "result",
-        "temp",
-    }
-    return len(var_name) > 6 and var_name.lower() not in generic_names
+    return len(var_name) > 6 and var_name.lower() not in _GENERIC_CONSTANT_NAMES
 
 
 def _is_named_string_constant_pattern(var_name: str, rhs_node: ast.expr) -> bool:
@@ -789,7 +787,7 @@ def is_safe_to_splice_into_fstring(value: str, encoding: str = "utf-8") -> bool:
     """`encoding` defaults to "utf-8" — this codebase's overwhelmingly
     common case, and the only option available at check() time, which
     (unlike fix()) never learns a file's real PEP 263 declared encoding.
-    `autofix.apply_fixes` calls this again at fix time with the real
+    `autofix.fix_source` calls this again at fix time with the real
     encoding, so a file declaring something narrower (e.g. `# -*- coding:
     ascii -*-`) still gets this validated correctly before anything is
     written — see exceeds_line_length_when_inlined's docstring for why
@@ -152,6 +152,9 @@ def analyze_function(
     created_containers: set[str] = set()
     appended_to: set[str] = set()
     has_loop_checking_exists_or_parent = False
+    # Judged only once get_assigned_vars/created_containers are complete,
+    # so collected in the same walk and checked after it.
+    returns: list[ast.Return] = []
 
     defined_classes: set[str] = set()
     for stmt in func_node.body:
@@ -159,6 +162,8 @@ def analyze_function(
             defined_classes.add(stmt.name)
 
     for node in ast.walk(func_node):
+        if isinstance(node, ast.Return):
+            returns.append(node)
         if isinstance(node, (ast.Yield, ast.YieldFrom)):
             flags["yields"] = True
         if isinstance(node, ast.Call):
@@ -214,6 +219,8 @@ def analyze_function(
         if isinstance(node, ast.Assign):
             for target in node.targets:
                 if isinstance(target, ast.Name):
+                    if target.id.lower() in ("errors", "errs", "error_list"):
+                        flags["validates"] = True
                     # x = [] or x = {} or x = list()/dict()
                     if isinstance(node.value, (ast.List, ast.Dict)):
                         created_containers.add(target.id)
@@ -286,23 +293,22 @@ def analyze_function(
 
     # Delegation: the function returns a variable assigned by get_*, or
     # returns a call to get_* directly.
-    for node in ast.walk(func_node):
-        if isinstance(node, ast.Return):
-            if isinstance(node.value, ast.Call):
-                call_name = _call_name(node.value.func)
-                if call_name and call_name.startswith(GET_PREFIX):
-                    flags["delegates_get"] = True
-            if isinstance(node.value, ast.Name) and node.value.id in get_assigned_vars:
+    for ret in returns:
+        if isinstance(ret.value, ast.Call):
+            call_name = _call_name(ret.value.func)
+            if call_name and call_name.startswith(GET_PREFIX):
                 flags["delegates_get"] = True
-            if isinstance(node.value, ast.Name) and node.value.id in created_containers:
-                flags["collects"] = True
-            if isinstance(node.value, ast.Name) and node.value.id in defined_classes:
+        if isinstance(ret.value, ast.Name) and ret.value.id in get_assigned_vars:
+            flags["delegates_get"] = True
+        if isinstance(ret.value, ast.Name) and ret.value.id in created_containers:
+            flags["collects"] = True
+        if isinstance(ret.value, ast.Name) and ret.value.id in defined_classes:
+            flags["returns_class"] = True
+        # type()/type[...] calls are metaclass operations.
+        if isinstance(ret.value, ast.Call):
+            call_name = _call_name(ret.value.func)
+            if call_name == "type":
                 flags["returns_class"] = True
-            # type()/type[...] calls are metaclass operations.
-            if isinstance(node.value, ast.Call):
-                call_name = _call_name(node.value.func)
-                if call_name == "type":
-                    flags["returns_class"] = True
 
     if created_containers & appended_to:
         flags["collects"] = True
@@ -310,16 +316,6 @@ def analyze_function(
     if has_loop_checking_exists_or_parent:
         flags["searches"] = True
 
-    assigns = [n for n in ast.walk(func_node) if isinstance(n, ast.Assign)]
-    for a in assigns:
-        for t in a.targets:
-            if isinstance(t, ast.Name) and t.id.lower() in (
-                "errors",
-                "errs",
-                "error_list",
-            ):
-                flags["validates"] = True
-
     return flags
 
 
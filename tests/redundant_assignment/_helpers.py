@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,9 +12,37 @@ if TYPE_CHECKING:
     from pre_commit_hooks.ast_checks._base import Violation
 
 
+_FAKE_PATH = Path("test.py")
+
+# The canonical fixable case: a constant used once, immediately, in a function.
+_SRC_FUNC_SCOPE_SINGLE_USE = """def func_scope():
+    x = "foo"
+    func(x=x)
+"""
+
+
+# Shared across tests: RedundantAssignmentCheck only reads the tree, and
+# the same snippet is often checked at several aggressiveness levels.
+@functools.cache
+def _parse(source: str) -> ast.Module:
+    return ast.parse(source)
+
+
+# Shared across tests: every caller only reads the returned node.
+@functools.cache
+def _parse_expr(source: str) -> ast.expr:
+    return ast.parse(source, mode="eval").body
+
+
 def _check(
     source: str,
-    path: str = "test.py",
+    path: Path = _FAKE_PATH,
     level: AggressivenessLevel = AggressivenessLevel.CONSERVATIVE,
 ) -> list[Violation]:
-    return RedundantAssignmentCheck(level=level).check(Path(path), ast.parse(source), source)
+    return RedundantAssignmentCheck(level=level).check(path, _parse(source), source)
+
+
+def _flagged_names(violations: list[Violation]) -> set[str]:
+    # Every TRI005 violation carries its variable name in fix_data (see
+    # RedundantAssignmentFixData), so tests needn't match message wording.
+    return {v.fix_data["var_name"] for v in violations if v.fix_data is not None}
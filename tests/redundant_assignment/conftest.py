@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import pytest
+
+from pre_commit_hooks.ast_checks.redundant_assignment import RedundantAssignmentCheck
+
+
+@pytest.fixture(scope="session")
+def check() -> RedundantAssignmentCheck:
+    return RedundantAssignmentCheck()
@@ -16,18 +16,18 @@ from pre_commit_hooks.ast_checks.redundant_assignment.analysis import (
     is_preceded_by_call,
 )
 from pre_commit_hooks.ast_checks.redundant_assignment.semantic import AggressivenessLevel
-from tests.redundant_assignment._helpers import _check
+from tests.redundant_assignment._helpers import _check, _flagged_names, _parse, _parse_expr
 
 
 def _lifecycle_for(source: str, var_name: str) -> VariableLifecycle:
     tracker = VariableTracker(source)
-    tracker.visit(ast.parse(source))
+    tracker.visit(_parse(source))
     return next(lc for lc in tracker.build_lifecycles() if lc.assignment.var_name == var_name)
 
 
 def _lifecycle_count(source: str, var_name: str) -> int:
     tracker = VariableTracker(source)
-    tracker.visit(ast.parse(source))
+    tracker.visit(_parse(source))
     return len([lc for lc in tracker.build_lifecycles() if lc.assignment.var_name == var_name])
 
 
@@ -73,8 +73,26 @@ def example():
             "x",
             2,
         ),
+        # A Starred element inside a tuple-unpacking target (`a, *b =
+        # ...`) rebinds `first` just like a plain Name element would.
+        (
+            """
+def func():
+    first = None
+    if cond:
+        first, *rest = compute()
+    return first
+""",
+            "first",
+            2,
+        ),
+    ],
+    ids=[
+        "scope-isolation",
+        "multiple-plain-assignments",
+        "multiple-annotated-assignments",
+        "starred-tuple-rebinding",
     ],
-    ids=["scope-isolation", "multiple-plain-assignments", "multiple-annotated-assignments"],
 )
 def test_lifecycle_count_for_variable(source: str, var_name: str, count: int) -> None:
     assert _lifecycle_count(source, var_name) == count
@@ -94,91 +112,38 @@ def example():
     assert _check(source) == []
 
 
-def test_augmented_assignment_tracks_usage() -> None:
-    source = """
+@pytest.mark.parametrize(
+    ("source", "var_name", "use_count"),
+    [
+        # The read in `x += 2` (augmented assignment) and the use in
+        # `print(x)`.
+        (
+            """
 def example():
     x = 1
     x += 2
     print(x)
-"""
-    lifecycle = _lifecycle_for(source, "x")
-    # Two uses: the read in `x += 2` (augmented assignment) and the use
-    # in `print(x)`.
-    assert len(lifecycle.uses) == 2
-
-
-def test_repeated_augmented_assignment_reuses_existing_uses_key() -> None:
-    # Branch coverage: a second augmented assignment to the same variable
-    # in the same scope appends to the existing self.uses[key] list
-    # rather than recreating it.
-    source = """
+""",
+            "x",
+            2,
+        ),
+        # Branch coverage: a second augmented assignment to the same
+        # variable in the same scope appends to the existing
+        # self.uses[key] list rather than recreating it. Each `x += n`
+        # counts as one use (the implicit read).
+        (
+            """
 def example():
     x = 0
     x += 1
     x += 2
-"""
-    lifecycle = _lifecycle_for(source, "x")
-    # Each `x += n` counts as one use (the implicit read).
-    assert len(lifecycle.uses) == 2
-
-
-def test_named_expr_rebinding_skipped_for_global_variable() -> None:
-    # Branch coverage: a walrus target declared `global` in this scope
-    # must not be tracked as a rebinding use here — matching
-    # visit_AugAssign's own global exclusion, since a global rebinding
-    # isn't a local snapshot hazard this tracker resolves.
-    source = """
-def func():
-    global x
-    return (x := 1)
-"""
-    # Must not raise; global walrus targets are silently skipped.
-    VariableTracker(source).visit(ast.parse(source))
-
-
-def test_tuple_unpacking_rebinding_skipped_for_global_variable() -> None:
-    # Branch coverage: a tuple-unpacking target declared `global` in this
-    # scope must not be recorded as a rebinding marker here either — same
-    # exclusion as the plain-Name assignment path and the walrus case
-    # above.
-    source = """
-def func():
-    global x
-    x, y = compute()
-"""
-    VariableTracker(source).visit(ast.parse(source))
-
-
-def test_starred_tuple_target_recorded_as_rebinding() -> None:
-    # A Starred element inside a tuple-unpacking target (`a, *b = ...`)
-    # rebinds `first` just like a plain Name element would.
-    source = """
-def func():
-    first = None
-    if cond:
-        first, *rest = compute()
-    return first
-"""
-    assert _lifecycle_count(source, "first") == 2
-
-
-def test_attribute_target_nested_in_tuple_tracked_as_usage() -> None:
-    # An Attribute/Subscript element inside a tuple-unpacking target
-    # (`obj.attr, first = ...`) reads `obj`, same as a bare `obj.attr =
-    # value` would.
-    source = """
-def func(obj):
-    obj.attr, first = compute()
-    return first
-"""
-    tracker = VariableTracker(source)
-    tracker.visit(ast.parse(source))
-    obj_uses = tracker.uses[next(key for key in tracker.uses if key[1] == "obj")]
-    assert any(use.context == "attribute_or_subscript_assignment" for use in obj_uses)
-
-
-def test_decorator_use_is_tracked_by_variable_tracker() -> None:
-    source = """
+""",
+            "x",
+            2,
+        ),
+        # @app.route("/") and return app.
+        (
+            """
 def outer():
     app = make_app()
 
@@ -187,14 +152,13 @@ def outer():
         pass
 
     return app
-"""
-    lifecycle = _lifecycle_for(source, "app")
-    # Two uses: @app.route("/") and return app.
-    assert len(lifecycle.uses) == 2
-
-
-def test_class_decorator_use_is_tracked() -> None:
-    source = """
+""",
+            "app",
+            2,
+        ),
+        # @validator.register (decorator) and return validator.
+        (
+            """
 def factory():
     validator = build_validator()
 
@@ -203,43 +167,90 @@ def factory():
         pass
 
     return validator
-"""
-    lifecycle = _lifecycle_for(source, "validator")
-    # Two uses: @validator.register (decorator) and return validator.
-    assert len(lifecycle.uses) == 2
+""",
+            "validator",
+            2,
+        ),
+        # Branch coverage: when the same variable is the base of two
+        # separate attribute assignments (``obj.x = 1`` then ``obj.y =
+        # 2``), the second call to _track_attribute_or_subscript_base_usage
+        # finds the key already present in self.uses and must append rather
+        # than create a new list: obj.x = 1, obj.y = 2, return obj.
+        (
+            """
+def outer():
+    obj = make_obj()
+    obj.x = 1
+    obj.y = 2
+    return obj
+""",
+            "obj",
+            3,
+        ),
+    ],
+    ids=[
+        "augmented-assignment",
+        "repeated-augmented-assignment",
+        "function-decorator",
+        "class-decorator",
+        "repeated-attribute-assignment-base",
+    ],
+)
+def test_lifecycle_use_count(source: str, var_name: str, use_count: int) -> None:
+    assert len(_lifecycle_for(source, var_name).uses) == use_count
 
 
-def test_track_attribute_assignment_with_non_name_base() -> None:
-    # Branch coverage: when the target of an assignment is something like
-    # ``func().attr = v`` (a method-call result), unwinding the Attribute
-    # chain leads to a Call node, not a Name.
-    # _track_attribute_or_subscript_base_usage must skip tracking rather
-    # than crashing.
-    source = """
+@pytest.mark.parametrize(
+    "source",
+    [
+        # Branch coverage: a walrus target declared `global` in this scope
+        # must not be tracked as a rebinding use here — matching
+        # visit_AugAssign's own global exclusion, since a global rebinding
+        # isn't a local snapshot hazard this tracker resolves.
+        """
+def func():
+    global x
+    return (x := 1)
+""",
+        # Branch coverage: a tuple-unpacking target declared `global` in
+        # this scope must not be recorded as a rebinding marker here either
+        # — same exclusion as the plain-Name assignment path and the walrus
+        # case above.
+        """
+def func():
+    global x
+    x, y = compute()
+""",
+        # Branch coverage: when the target of an assignment is something
+        # like ``func().attr = v`` (a method-call result), unwinding the
+        # Attribute chain leads to a Call node, not a Name.
+        # _track_attribute_or_subscript_base_usage must skip tracking
+        # rather than crashing.
+        """
 def outer():
     get_obj().attr = "value"
     return 42
-"""
-    # Must not raise; call-result targets are silently skipped.
-    VariableTracker(source).visit(ast.parse(source))
+""",
+    ],
+    ids=["global-walrus-target", "global-tuple-unpacking-target", "call-result-attribute-target"],
+)
+def test_tracker_silently_skips_untracked_targets(source: str) -> None:
+    VariableTracker(source).visit(_parse(source))
 
 
-def test_track_attribute_assignment_key_already_in_uses() -> None:
-    # Branch coverage: when the same variable is the base of two separate
-    # attribute assignments (``obj.x = 1`` then ``obj.y = 2``), the second
-    # call to _track_attribute_or_subscript_base_usage finds the key
-    # already present in self.uses and must append rather than create a
-    # new list.
+def test_attribute_target_nested_in_tuple_tracked_as_usage() -> None:
+    # An Attribute/Subscript element inside a tuple-unpacking target
+    # (`obj.attr, first = ...`) reads `obj`, same as a bare `obj.attr =
+    # value` would.
     source = """
-def outer():
-    obj = make_obj()
-    obj.x = 1
-    obj.y = 2
-    return obj
+def func(obj):
+    obj.attr, first = compute()
+    return first
 """
-    lifecycle = _lifecycle_for(source, "obj")
-    # obj is used in: obj.x = 1, obj.y = 2, return obj -> 3 uses.
-    assert len(lifecycle.uses) == 3
+    tracker = VariableTracker(source)
+    tracker.visit(_parse(source))
+    obj_uses = tracker.uses[next(key for key in tracker.uses if key[1] == "obj")]
+    assert any(use.context == "attribute_or_subscript_assignment" for use in obj_uses)
 
 
 def test_in_comprehension_flag_set_correctly() -> None:
@@ -337,23 +348,6 @@ async def f(obj):
     assert lifecycle.rhs_reference_reassigned_before_use is True
 
 
-def test_variable_tracker_scope_isolation() -> None:
-    assert (
-        _lifecycle_count(
-            """
-def outer():
-    x = "outer"
-    def inner():
-        x = "inner"
-        return x
-    return x
-""",
-            "x",
-        )
-        == 2
-    )
-
-
 def test_get_source_segment_error_handling() -> None:
     node = ast.Constant(value=1, lineno=-1, col_offset=-1)
     assert VariableTracker("x = 1")._get_source_segment(node) == ""
@@ -835,11 +829,11 @@ def f(command):
         case "go":
             sink(value)
 """
-    assert all("'value'" not in v.message for v in _check(source))
+    assert "value" not in _flagged_names(_check(source))
 
 
 def test_lifecycle_no_uses_not_immediate() -> None:
-    rhs_node = ast.parse("func()", mode="eval").body
+    rhs_node = _parse_expr("func()")
     assignment = AssignmentInfo(
         var_name="x",
         line=1,
@@ -862,7 +856,7 @@ def test_lifecycle_is_immediate_use_with_closure() -> None:
         line=1,
         col=0,
         stmt_index=0,
-        rhs_node=ast.parse("1", mode="eval").body,
+        rhs_node=_parse_expr("1"),
         rhs_source="1",
         scope_id=1,  # Outer scope
         has_type_annotation=False,
@@ -1,34 +1,42 @@
 from __future__ import annotations
 
 import ast
-from pathlib import Path
+import re
+from typing import TYPE_CHECKING
 
 import pytest
 
 from pre_commit_hooks.ast_checks._base import is_fix_failed
-from pre_commit_hooks.ast_checks.redundant_assignment import RedundantAssignmentCheck
 from pre_commit_hooks.ast_checks.redundant_assignment.autofix import (
     _can_safely_inline,
     _cleanup_blank_lines_around_removals,
     apply_fixes,
+    fix_source,
 )
 from tests.factories import ViolationFactory
+from tests.redundant_assignment._helpers import _FAKE_PATH, _SRC_FUNC_SCOPE_SINGLE_USE, _flagged_names
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pre_commit_hooks.ast_checks.redundant_assignment import RedundantAssignmentCheck
+
+# The run of blank lines directly above the first ``return``.
+_BLANKS_BEFORE_RETURN = re.compile(r"^((?:[ \t]*\n)*)[ \t]*return\b", re.MULTILINE)
+
+_SRC_X_EQ_1 = "x = 1\nprint(x)\n"
 
 # ---------------------------------------------------------------------------
 # fix() / apply_fixes(): file-mutation regression tests
 # ---------------------------------------------------------------------------
 
 
-def test_fix_method_with_fixable_violations(tmp_path: Path) -> None:
-    source = """def func_scope():
-    x = "foo"
-    func(x=x)
-"""
+def test_fix_method_with_fixable_violations(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
+    source = _SRC_FUNC_SCOPE_SINGLE_USE
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert len(violations) >= 1
@@ -43,7 +51,7 @@ def test_fix_method_with_fixable_violations(tmp_path: Path) -> None:
     assert 'func(x="foo")' in fixed_content
 
 
-def test_fix_two_assignments_used_on_the_same_line(tmp_path: Path) -> None:
+def test_fix_two_assignments_used_on_the_same_line(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression: two independently-fixable assignments whose single uses
     # land on the same line must both be inlined, even when the
     # replacement text is a different length than the variable it
@@ -58,7 +66,6 @@ def test_fix_two_assignments_used_on_the_same_line(tmp_path: Path) -> None:
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert check.fix(filepath, violations, source, tree) is True
@@ -70,6 +77,7 @@ def test_fix_two_assignments_used_on_the_same_line(tmp_path: Path) -> None:
 
 
 def test_fix_chained_assignment_where_use_line_is_another_assign_line(
+    check: RedundantAssignmentCheck,
     tmp_path: Path,
 ) -> None:
     # Regression: x's only use is on the same line as y's assignment (`y
@@ -84,7 +92,6 @@ def test_fix_chained_assignment_where_use_line_is_another_assign_line(
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert check.fix(filepath, violations, source, tree) is True
@@ -94,20 +101,18 @@ def test_fix_chained_assignment_where_use_line_is_another_assign_line(
     assert "return x" in fixed_content
 
 
-def test_fix_write_failure_returns_false(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+def test_fix_write_failure_returns_false(
+    check: RedundantAssignmentCheck, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
     # Regression: apply_fixes() used to let atomic_write_text()'s OSError
     # propagate uncaught instead of returning False like every other check's
     # fix().
-    source = """def func_scope():
-    x = "foo"
-    func(x=x)
-"""
+    source = _SRC_FUNC_SCOPE_SINGLE_USE
     # Point at a path inside a directory that doesn't exist so the
     # temp-file-then-rename write raises OSError.
     filepath = tmp_path / "missing_dir" / "source.py"
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     with caplog.at_level("DEBUG"):
@@ -124,31 +129,81 @@ def test_fix_write_failure_returns_false(tmp_path: Path, caplog: pytest.LogCaptu
     assert all(record.levelname == "DEBUG" for record in caplog.records)
 
 
-def test_autofix_skips_violation_without_fix_data(tmp_path: Path) -> None:
-    source = "x = 1\nprint(x)\n"
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    violation = ViolationFactory.build(
-        check_id="redundant-assignment", error_code="TRI005", fixable=True, fix_data=None
-    )
-
-    check = RedundantAssignmentCheck()
-    assert check.fix(filepath, [violation], source, ast.parse(source)) is False
-
-
-def test_autofix_skips_violation_with_invalid_fix_data(tmp_path: Path) -> None:
-    source = "x = 1\nprint(x)\n"
+@pytest.mark.parametrize(
+    ("source", "fix_data"),
+    [
+        (_SRC_X_EQ_1, None),
+        # fix_data is missing 'use_line'.
+        (_SRC_X_EQ_1, {"other_key": "value"}),
+        (
+            _SRC_X_EQ_1,
+            {
+                "pattern": "IMMEDIATE_SINGLE_USE",
+                "assign_line": 100,  # Invalid line number
+                "var_name": "x",
+                "rhs_source": "1",
+                "use_line": 2,
+                "use_col": 6,
+            },
+        ),
+        (
+            _SRC_X_EQ_1,
+            {
+                "pattern": "IMMEDIATE_SINGLE_USE",
+                "assign_line": 1,
+                "var_name": "x",
+                "rhs_source": "1",
+                "use_line": 100,  # Invalid line number
+                "use_col": 6,
+            },
+        ),
+        # RedundantAssignmentCheck.check() leaves use_line/use_col unset
+        # whenever a lifecycle doesn't have exactly one use.
+        (
+            "x = 1\nprint(x)\nprint(x)\n",
+            {
+                "pattern": "SINGLE_USE",
+                "assign_line": 1,
+                "var_name": "x",
+                "rhs_source": "1",
+                "use_line": None,
+                "use_col": None,
+            },
+        ),
+        # Line is already 60 chars; adding a 40-char value would exceed 88.
+        (
+            "x = " + "a" * 40 + "\nresult = some_long_function_name(x, param1, param2)\n",
+            {
+                "pattern": "IMMEDIATE_SINGLE_USE",
+                "assign_line": 1,
+                "var_name": "x",
+                "rhs_source": "a" * 40,
+                "use_line": 2,
+                "use_col": 41,  # Position of 'x' in the usage line
+            },
+        ),
+    ],
+    ids=[
+        "no-fix-data",
+        "invalid-fix-data",
+        "invalid-assignment-line",
+        "invalid-usage-line",
+        "multiple-uses",
+        "unsafe-inlining",
+    ],
+)
+def test_autofix_declines_unusable_fix_data(
+    check: RedundantAssignmentCheck, tmp_path: Path, source: str, fix_data: dict[str, object] | None
+) -> None:
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
-    # fix_data is missing 'use_line'.
     violation = ViolationFactory.build(
-        check_id="redundant-assignment", error_code="TRI005", fixable=True, fix_data={"other_key": "value"}
+        check_id="redundant-assignment", error_code="TRI005", fixable=True, fix_data=fix_data
     )
 
-    check = RedundantAssignmentCheck()
     assert check.fix(filepath, [violation], source, ast.parse(source)) is False
+    assert filepath.read_text() == source
 
 
 def test_autofix_skips_multiline_rhs() -> None:
@@ -169,101 +224,6 @@ def test_autofix_skips_invalid_line_indices() -> None:
     assert _can_safely_inline("x", "value", 10, source_lines) is False  # out of bounds
 
 
-def test_autofix_with_invalid_assignment_line(tmp_path: Path) -> None:
-    source = "x = 1\nprint(x)\n"
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    violation = ViolationFactory.build(
-        check_id="redundant-assignment",
-        error_code="TRI005",
-        fixable=True,
-        fix_data={
-            "pattern": "IMMEDIATE_SINGLE_USE",
-            "assign_line": 100,  # Invalid line number
-            "var_name": "x",
-            "rhs_source": "1",
-            "use_line": 2,
-            "use_col": 6,
-        },
-    )
-
-    check = RedundantAssignmentCheck()
-    assert check.fix(filepath, [violation], source, ast.parse(source)) is False
-
-
-def test_autofix_with_invalid_usage_line(tmp_path: Path) -> None:
-    source = "x = 1\nprint(x)\n"
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    violation = ViolationFactory.build(
-        check_id="redundant-assignment",
-        error_code="TRI005",
-        fixable=True,
-        fix_data={
-            "pattern": "IMMEDIATE_SINGLE_USE",
-            "assign_line": 1,
-            "var_name": "x",
-            "rhs_source": "1",
-            "use_line": 100,  # Invalid line number
-            "use_col": 6,
-        },
-    )
-
-    check = RedundantAssignmentCheck()
-    assert check.fix(filepath, [violation], source, ast.parse(source)) is False
-
-
-def test_autofix_with_multiple_uses(tmp_path: Path) -> None:
-    source = "x = 1\nprint(x)\nprint(x)\n"
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    # RedundantAssignmentCheck.check() leaves use_line/use_col unset
-    # whenever a lifecycle doesn't have exactly one use.
-    violation = ViolationFactory.build(
-        check_id="redundant-assignment",
-        error_code="TRI005",
-        fixable=True,
-        fix_data={
-            "pattern": "SINGLE_USE",
-            "assign_line": 1,
-            "var_name": "x",
-            "rhs_source": "1",
-            "use_line": None,
-            "use_col": None,
-        },
-    )
-
-    check = RedundantAssignmentCheck()
-    assert check.fix(filepath, [violation], source, ast.parse(source)) is False
-
-
-def test_autofix_with_unsafe_inlining(tmp_path: Path) -> None:
-    # Line is already 60 chars; adding a 40-char value would exceed 88.
-    source = "x = " + "a" * 40 + "\nresult = some_long_function_name(x, param1, param2)\n"
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    violation = ViolationFactory.build(
-        check_id="redundant-assignment",
-        error_code="TRI005",
-        fixable=True,
-        fix_data={
-            "pattern": "IMMEDIATE_SINGLE_USE",
-            "assign_line": 1,
-            "var_name": "x",
-            "rhs_source": "a" * 40,
-            "use_line": 2,
-            "use_col": 41,  # Position of 'x' in the usage line
-        },
-    )
-
-    check = RedundantAssignmentCheck()
-    assert check.fix(filepath, [violation], source, ast.parse(source)) is False
-
-
 def test_fix_method_with_no_fixable_violations() -> None:
     source = """
 x = "foo"
@@ -272,53 +232,43 @@ func(x=x)
     violation = ViolationFactory.build(
         check_id="redundant-assignment", error_code="TRI005", fixable=False, fix_data=None
     )
-    assert apply_fixes(Path("test.py"), [violation], source) is False
+    assert apply_fixes(_FAKE_PATH, [violation], source) is False
 
 
-def test_autofix_simple_constant(tmp_path: Path) -> None:
+def test_autofix_simple_constant(check: RedundantAssignmentCheck) -> None:
     source = """def f():
     y = 42
     result = y + 10
     return result
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     fixable_violations = [v for v in violations if v.fixable]
     assert fixable_violations
-    assert check.fix(filepath, fixable_violations, source, tree) is True
-
-    fixed_content = filepath.read_text()
+    fixed_content, applied = fix_source(fixable_violations, source)
+    assert applied
     assert "y = 42" not in fixed_content
     assert "result = 42 + 10" in fixed_content
 
 
-def test_autofix_simple_attribute(tmp_path: Path) -> None:
+def test_autofix_simple_attribute(check: RedundantAssignmentCheck) -> None:
     source = """def f():
     v = obj.attr
     use(v)
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     fixable_violations = [v for v in violations if v.fixable]
     assert fixable_violations
-    assert check.fix(filepath, fixable_violations, source, tree) is True
-
-    fixed_content = filepath.read_text()
+    fixed_content, applied = fix_source(fixable_violations, source)
+    assert applied
     assert "v = obj.attr" not in fixed_content
     assert "use(obj.attr)" in fixed_content
 
 
-def test_autofix_word_boundaries(tmp_path: Path) -> None:
+def test_autofix_word_boundaries(check: RedundantAssignmentCheck) -> None:
     # `return max(x, 10)` directly (no intermediate `result =`), so `x` is
     # the only redundant assignment in play — `result = max(x, 10); return
     # result` would make `result` itself independently fixable too (issue
@@ -329,44 +279,35 @@ def test_autofix_word_boundaries(tmp_path: Path) -> None:
     x = 5
     return max(x, 10)
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     fixable_violations = [v for v in violations if v.fixable]
     assert fixable_violations
-    assert check.fix(filepath, fixable_violations, source, tree) is True
-
-    fixed_content = filepath.read_text()
+    fixed_content, applied = fix_source(fixable_violations, source)
+    assert applied
     # Should replace 'x' but not affect 'max'.
     assert "return max(5, 10)" in fixed_content
     assert "max" in fixed_content
 
 
-def test_autofix_handles_word_boundaries(tmp_path: Path) -> None:
+def test_autofix_handles_word_boundaries(check: RedundantAssignmentCheck) -> None:
     source = """
 def func(index):
     x = 5
     return max(x, index)
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     assert any(v.fixable for v in violations)
-    check.fix(filepath, violations, source, tree)
+    fixed_content, _ = fix_source(violations, source)
 
     # Should only replace the standalone 'x', not 'max' or 'index'.
-    assert "max(5, index)" in filepath.read_text()
+    assert "max(5, index)" in fixed_content
 
 
-def test_autofix_respects_line_length(tmp_path: Path) -> None:
+def test_autofix_respects_line_length(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # `x` and its RHS are both short enough to pass should_report_violation's
     # conservative report-time estimate, but the *actual* usage line (with
     # several other long arguments already on it) would exceed 79 chars once
@@ -381,13 +322,13 @@ def func():
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
-    violations = RedundantAssignmentCheck().check(filepath, ast.parse(source), source)
+    violations = check.check(filepath, ast.parse(source), source)
 
     assert violations
     assert all(not v.fixable for v in violations)
 
 
-def test_zero_arg_call_immediate_single_use_is_fixable(tmp_path: Path) -> None:
+def test_zero_arg_call_immediate_single_use_is_fixable(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression test (issue #22): IMMEDIATE_SINGLE_USE never allowed a
     # Call RHS, even trivial zero-arg ones, so idiomatic test code like
     # `check = ForbidVarsCheck(); check.check(...)` was never auto-fixed.
@@ -401,7 +342,6 @@ def test_zero_arg_call_immediate_single_use_is_fixable(tmp_path: Path) -> None:
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     check_violations = [v for v in violations if "'check'" in v.message]
@@ -416,6 +356,7 @@ def test_zero_arg_call_immediate_single_use_is_fixable(tmp_path: Path) -> None:
 
 
 def test_augmented_assignment_use_not_flagged_for_zero_arg_call(
+    check: RedundantAssignmentCheck,
     tmp_path: Path,
 ) -> None:
     # Regression test: the issue #22 zero-arg-call carve-out for
@@ -429,10 +370,9 @@ def test_augmented_assignment_use_not_flagged_for_zero_arg_call(
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
-    assert all("'x'" not in v.message for v in violations)
+    assert "x" not in _flagged_names(violations)
 
     # Even if something slipped through and marked it fixable, fix() must
     # never corrupt the file.
@@ -508,12 +448,13 @@ def test_augmented_assignment_use_not_flagged_for_zero_arg_call(
         "short-circuited-boolop",
     ],
 )
-def test_zero_arg_call_use_not_fixable(tmp_path: Path, source: str, message_filter: str) -> None:
+def test_zero_arg_call_use_not_fixable(
+    check: RedundantAssignmentCheck, tmp_path: Path, source: str, message_filter: str
+) -> None:
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     matching = [v for v in violations if message_filter in v.message]
@@ -546,17 +487,18 @@ def test_zero_arg_call_use_not_fixable(tmp_path: Path, source: str, message_filt
     ],
     ids=["immediate-before-loop", "intervening-statement-before-loop"],
 )
-def test_single_use_call_in_loop_body_not_reported(tmp_path: Path, source: str) -> None:
+def test_single_use_call_in_loop_body_not_reported(
+    check: RedundantAssignmentCheck, tmp_path: Path, source: str
+) -> None:
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, ast.parse(source), source)
 
-    assert all("'value'" not in v.message for v in violations)
+    assert "value" not in _flagged_names(violations)
 
 
-def test_call_rhs_across_await_in_same_statement_not_reported(tmp_path: Path) -> None:
+def test_call_rhs_across_await_in_same_statement_not_reported(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # `await future` precedes `x` in evaluation order within this single
     # statement — inlining would run make() after the await instead of
     # before it, so this isn't a redundant assignment at all.
@@ -567,13 +509,12 @@ def test_call_rhs_across_await_in_same_statement_not_reported(tmp_path: Path) ->
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, ast.parse(source), source)
 
-    assert all("'x'" not in v.message for v in violations)
+    assert "x" not in _flagged_names(violations)
 
 
-def test_autofix_preserves_blank_lines_across_file(tmp_path: Path) -> None:
+def test_autofix_preserves_blank_lines_across_file(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression: autofix used to delete blank lines across the entire
     # file, not just around the removed assignment.
     source = """class FirstClass:
@@ -600,7 +541,6 @@ class ThirdClass:
         pass
 """
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
 
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
@@ -623,7 +563,7 @@ class ThirdClass:
     ast.parse(fixed_content)
 
 
-def test_autofix_cleans_up_excessive_blank_lines(tmp_path: Path) -> None:
+def test_autofix_cleans_up_excessive_blank_lines(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     source = """def function_with_redundant():
 
 
@@ -633,7 +573,6 @@ def test_autofix_cleans_up_excessive_blank_lines(tmp_path: Path) -> None:
     return x
 """
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
 
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
@@ -645,16 +584,9 @@ def test_autofix_cleans_up_excessive_blank_lines(tmp_path: Path) -> None:
     check.fix(filepath, violations, source, tree)
     fixed_content = filepath.read_text()
 
-    lines = fixed_content.split("\n")
-    def_index = next(i for i, line in enumerate(lines) if "def function_with_redundant" in line)
-    return_index = next(i for i in range(def_index, len(lines)) if "return" in lines[i])
-    blanks_before_return = 0
-    j = return_index - 1
-    while j >= 0 and lines[j].strip() == "":
-        blanks_before_return += 1
-        j -= 1
-
-    assert blanks_before_return <= 2
+    match = _BLANKS_BEFORE_RETURN.search(fixed_content)
+    assert match is not None
+    assert match.group(1).count("\n") <= 2
 
     # Verify the fixed code is still valid Python; raises on failure.
     ast.parse(fixed_content)
@@ -676,7 +608,9 @@ def test_cleanup_blank_lines_only_excess_above() -> None:
     assert lines[3] == "code\n"
 
 
-def test_fix_preserves_trailing_comment_on_string_ending_in_escaped_backslash(tmp_path: Path) -> None:
+def test_fix_preserves_trailing_comment_on_string_ending_in_escaped_backslash(
+    check: RedundantAssignmentCheck, tmp_path: Path
+) -> None:
     # Regression: the old naive comment-detection heuristic missed the
     # trailing comment on a line like `sep = "\\"  # comment` (an escaped
     # backslash right before the closing quote), so should_report_violation
@@ -688,14 +622,15 @@ def test_fix_preserves_trailing_comment_on_string_ending_in_escaped_backslash(tm
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, ast.parse(source), source)
 
     assert violations == []
     assert filepath.read_text() == source
 
 
-def test_check_reports_assignment_after_multiline_string_with_trailing_comment(tmp_path: Path) -> None:
+def test_check_reports_assignment_after_multiline_string_with_trailing_comment(
+    check: RedundantAssignmentCheck, tmp_path: Path
+) -> None:
     # Regression: tokenize reports a multiline STRING token's line as only
     # its start line, not every line it spans, so a comment trailing the
     # closing `"""` on a later line was misclassified as comment-only —
@@ -707,12 +642,12 @@ def test_check_reports_assignment_after_multiline_string_with_trailing_comment(t
     filepath = tmp_path / "source.py"
     filepath.write_text(source)
 
-    violations = RedundantAssignmentCheck().check(filepath, ast.parse(source), source)
+    violations = check.check(filepath, ast.parse(source), source)
 
-    assert any("'y'" in v.message for v in violations)
+    assert "y" in _flagged_names(violations)
 
 
-def test_autofix_splices_string_literal_into_fstring_field(tmp_path: Path) -> None:
+def test_autofix_splices_string_literal_into_fstring_field(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression (issue #72): inlining a string-literal variable into an
     # f-string replacement field used to re-quote it inside the braces
     # (`f"...{"requests-cache"}..."`) instead of splicing the literal's
@@ -725,7 +660,6 @@ def test_autofix_splices_string_literal_into_fstring_field(tmp_path: Path) -> No
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert any(v.fixable for v in violations)
@@ -739,7 +673,7 @@ def test_autofix_splices_string_literal_into_fstring_field(tmp_path: Path) -> No
     ast.parse(fixed_content)
 
 
-def test_autofix_declines_fstring_splice_with_unsafe_characters(tmp_path: Path) -> None:
+def test_autofix_declines_fstring_splice_with_unsafe_characters(check: RedundantAssignmentCheck) -> None:
     # A literal containing a quote character can't be safely spliced as raw
     # text without knowing (and re-escaping for) the f-string's own quote
     # style — declined conservatively rather than risking broken output.
@@ -747,22 +681,17 @@ def test_autofix_declines_fstring_splice_with_unsafe_characters(tmp_path: Path)
     name = "O'Brien"
     return f"Hello {name}!"
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     name_violations = [v for v in violations if "'name'" in v.message]
     assert name_violations
     assert all(not v.fixable for v in name_violations)
 
-    check.fix(filepath, violations, source, tree)
-    assert filepath.read_text() == source
+    assert fix_source(violations, source) == (source, [])
 
 
-def test_autofix_declines_fstring_splice_with_control_character(tmp_path: Path) -> None:
+def test_autofix_declines_fstring_splice_with_control_character(check: RedundantAssignmentCheck) -> None:
     # Regression: "\x1b[0m" (an ANSI reset code) is a valid, non-newline,
     # non-NUL string literal, so it passed every prior unsafe-character
     # check. Splicing it as a raw byte is syntactically fine but renders
@@ -772,65 +701,51 @@ def test_autofix_declines_fstring_splice_with_control_character(tmp_path: Path)
     reset = "\\x1b[0m"
     return f"{reset}"
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     reset_violations = [v for v in violations if "'reset'" in v.message]
     assert reset_violations
     assert all(not v.fixable for v in reset_violations)
 
-    check.fix(filepath, violations, source, tree)
-    assert filepath.read_text() == source
+    assert fix_source(violations, source) == (source, [])
 
 
-def test_autofix_declines_fstring_splice_with_nul_byte(tmp_path: Path) -> None:
+def test_autofix_declines_fstring_splice_with_nul_byte(check: RedundantAssignmentCheck) -> None:
     # Regression: `"\x00"` is a perfectly valid string literal, but Python's
     # tokenizer rejects any *source file* containing a raw NUL byte —
     # splicing it as literal text would turn a fixable file into an
     # unparsable one.
     source = 'def f():\n    label = "\\x00"\n    return f"<{label}>"\n'
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     label_violations = [v for v in violations if "'label'" in v.message]
     assert label_violations
     assert all(not v.fixable for v in label_violations)
 
-    check.fix(filepath, violations, source, tree)
-    assert filepath.read_text() == source
+    assert fix_source(violations, source) == (source, [])
 
 
-def test_autofix_declines_fstring_splice_with_unpaired_surrogate(tmp_path: Path) -> None:
+def test_autofix_declines_fstring_splice_with_unpaired_surrogate(check: RedundantAssignmentCheck) -> None:
     # Regression: a str object can legally hold an unpaired surrogate (e.g.
     # from a "\ud800" escape) even though no real text encoding can
     # represent one — splicing it as raw source text would make
     # atomic_write_text's compile()/write() crash with an uncaught
     # UnicodeEncodeError instead of declining the fix.
     source = 'def f():\n    label = "\\ud800"\n    return f"<{label}>"\n'
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     label_violations = [v for v in violations if "'label'" in v.message]
     assert label_violations
     assert all(not v.fixable for v in label_violations)
 
-    check.fix(filepath, violations, source, tree)
-    assert filepath.read_text() == source
+    assert fix_source(violations, source) == (source, [])
 
 
 def test_autofix_declines_fstring_splice_when_value_unencodable_in_declared_encoding(
+    check: RedundantAssignmentCheck,
     tmp_path: Path,
 ) -> None:
     # Regression: a PEP 263 file can declare a narrower encoding (e.g.
@@ -845,7 +760,6 @@ def test_autofix_declines_fstring_splice_when_value_unencodable_in_declared_enco
     filepath.write_bytes(source.encode("ascii"))
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     label_violations = [v for v in violations if "'label'" in v.message]
@@ -858,7 +772,7 @@ def test_autofix_declines_fstring_splice_when_value_unencodable_in_declared_enco
     assert filepath.read_bytes() == source.encode("ascii")
 
 
-def test_autofix_declines_fstring_splice_with_conversion(tmp_path: Path) -> None:
+def test_autofix_declines_fstring_splice_with_conversion(check: RedundantAssignmentCheck) -> None:
     # `{org!r}` applies repr() to the inlined literal, which is not the
     # same as splicing its raw text into the surrounding string — must be
     # declined rather than naively re-quoted.
@@ -866,22 +780,17 @@ def test_autofix_declines_fstring_splice_with_conversion(tmp_path: Path) -> None
     org = "requests-cache"
     return f"{org!r}"
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     org_violations = [v for v in violations if "'org'" in v.message]
     assert org_violations
     assert all(not v.fixable for v in org_violations)
 
-    check.fix(filepath, violations, source, tree)
-    assert filepath.read_text() == source
+    assert fix_source(violations, source) == (source, [])
 
 
-def test_autofix_declines_fstring_splice_for_nested_expression(tmp_path: Path) -> None:
+def test_autofix_declines_fstring_splice_for_nested_expression(check: RedundantAssignmentCheck) -> None:
     # `org` isn't the whole replacement field here (`org.upper()` is), so
     # there's no clean way to remove the braces and splice raw text without
     # changing what the field expression does.
@@ -889,22 +798,17 @@ def test_autofix_declines_fstring_splice_for_nested_expression(tmp_path: Path) -
     org = "requests-cache"
     return f"{org.upper()}"
 """
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
-    violations = check.check(filepath, tree, source)
+    violations = check.check(_FAKE_PATH, tree, source)
 
     org_violations = [v for v in violations if "'org'" in v.message]
     assert org_violations
     assert all(not v.fixable for v in org_violations)
 
-    check.fix(filepath, violations, source, tree)
-    assert filepath.read_text() == source
+    assert fix_source(violations, source) == (source, [])
 
 
-def test_autofix_fstring_field_unaffected_for_non_string_rhs(tmp_path: Path) -> None:
+def test_autofix_fstring_field_unaffected_for_non_string_rhs(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression guard: a non-string RHS (e.g. a number) was never buggy —
     # `f"{5}"` is fine as-is, no quotes involved — so the new f-string
     # handling must not change this existing, already-correct behavior.
@@ -916,7 +820,6 @@ def test_autofix_fstring_field_unaffected_for_non_string_rhs(tmp_path: Path) ->
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert any(v.fixable for v in violations)
@@ -927,7 +830,7 @@ def test_autofix_fstring_field_unaffected_for_non_string_rhs(tmp_path: Path) ->
     assert 'return f"Total: {5}"' in fixed_content
 
 
-def test_autofix_fstring_field_unaffected_for_name_rhs(tmp_path: Path) -> None:
+def test_autofix_fstring_field_unaffected_for_name_rhs(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression guard: a Name RHS used as a whole f-string field (e.g.
     # `x = obj; f"{x}"`) was never buggy either — `rhs_source` isn't a
     # string-literal expression at all here, so the new splice path must
@@ -941,7 +844,6 @@ def test_autofix_fstring_field_unaffected_for_name_rhs(tmp_path: Path) -> None:
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert any(v.fixable for v in violations)
@@ -952,7 +854,9 @@ def test_autofix_fstring_field_unaffected_for_name_rhs(tmp_path: Path) -> None:
     assert 'return f"value: {obj}"' in fixed_content
 
 
-def test_autofix_fstring_splice_declines_when_earlier_fix_lengthens_line(tmp_path: Path) -> None:
+def test_autofix_fstring_splice_declines_when_earlier_fix_lengthens_line(
+    check: RedundantAssignmentCheck, tmp_path: Path
+) -> None:
     # Regression: same-line violations are applied rightmost-first, so a
     # fix processed before this one can lengthen the line beyond what
     # should_autofix saw at check() time (see exceeds_line_length_when_inlined's
@@ -965,7 +869,6 @@ def test_autofix_fstring_splice_declines_when_earlier_fix_lengthens_line(tmp_pat
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     o_violations = [v for v in violations if "'o'" in v.message]
@@ -986,7 +889,7 @@ def test_autofix_fstring_splice_declines_when_earlier_fix_lengthens_line(tmp_pat
     assert 'p = "xxxx"' not in fixed_content
 
 
-def test_fix_inlines_use_on_line_with_non_ascii_text(tmp_path: Path) -> None:
+def test_fix_inlines_use_on_line_with_non_ascii_text(check: RedundantAssignmentCheck, tmp_path: Path) -> None:
     # Regression: ast.col_offset is a UTF-8 byte offset, not a character
     # offset. A non-ASCII character earlier on the use's line must not
     # throw off the position used to locate the variable for inlining.
@@ -1001,7 +904,6 @@ def test_fix_inlines_use_on_line_with_non_ascii_text(tmp_path: Path) -> None:
     filepath.write_text(source)
 
     tree = ast.parse(source)
-    check = RedundantAssignmentCheck()
     violations = check.check(filepath, tree, source)
 
     assert any(v.fixable for v in violations)
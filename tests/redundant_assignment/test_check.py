@@ -1,30 +1,31 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
 
 import pytest
 
 from pre_commit_hooks.ast_checks._orchestrator import CheckOrchestrator
 from pre_commit_hooks.ast_checks.redundant_assignment import RedundantAssignmentCheck
 from pre_commit_hooks.ast_checks.redundant_assignment.semantic import AggressivenessLevel
-from tests.redundant_assignment._helpers import _check
+from tests.redundant_assignment._helpers import _SRC_FUNC_SCOPE_SINGLE_USE, _check, _flagged_names
 
-if TYPE_CHECKING:
-    from pathlib import Path
+_SRC_SCREAMING_SNAKE_CONSTANT = """
+_GREY = "rgb(201, 203, 207)"
+config = {"colors": [_GREY]}
+"""
 
 # ---------------------------------------------------------------------------
 # Check metadata
 # ---------------------------------------------------------------------------
 
 
-def test_check_id_and_error_code() -> None:
-    check = RedundantAssignmentCheck()
+def test_check_id_and_error_code(check: RedundantAssignmentCheck) -> None:
     assert check.check_id == "redundant-assignment"
     assert check.error_code == "TRI005"
 
 
-def test_prefilter_pattern() -> None:
-    assert RedundantAssignmentCheck().get_prefilter_pattern() == [" = "]
+def test_prefilter_pattern(check: RedundantAssignmentCheck) -> None:
+    assert check.get_prefilter_pattern() == [" = "]
 
 
 def test_check_reports_character_offset_not_byte_offset_before_multibyte_text() -> None:
@@ -989,7 +990,7 @@ def func(c):
     ],
 )
 def test_check_never_flags_variable(source: str, path: str, excluded: str) -> None:
-    assert all(excluded not in v.message for v in _check(source, path))
+    assert all(excluded not in v.message for v in _check(source, Path(path)))
 
 
 # ---------------------------------------------------------------------------
@@ -1051,10 +1052,7 @@ def check_warning(conn):
             # SCREAMING_SNAKE_CASE module-level string constant used only
             # once elsewhere in the file reads as a deliberate, reusable
             # declaration (Rule 12), even though it's genuinely single-use.
-            """
-_GREY = "rgb(201, 203, 207)"
-config = {"colors": [_GREY]}
-""",
+            _SRC_SCREAMING_SNAKE_CONSTANT,
             "'_GREY'",
         ),
     ],
@@ -1074,12 +1072,8 @@ def test_screaming_snake_case_string_constant_still_flagged_at_permissive_level(
     # Rule 12 (see should_report_violation) is conservative-only, matching
     # Rule 11's precedent — permissive still reports every single-use
     # string assignment TRI005 always used to, name shape included.
-    source = """
-_GREY = "rgb(201, 203, 207)"
-config = {"colors": [_GREY]}
-"""
-    violations = _check(source, level=AggressivenessLevel.PERMISSIVE)
-    assert any("'_GREY'" in v.message for v in violations)
+    violations = _check(_SRC_SCREAMING_SNAKE_CONSTANT, level=AggressivenessLevel.PERMISSIVE)
+    assert "_GREY" in _flagged_names(violations)
 
 
 @pytest.mark.parametrize("level", [AggressivenessLevel.CONSERVATIVE, AggressivenessLevel.PERMISSIVE])
@@ -1091,7 +1085,7 @@ __author__ = "Hynek Schlawack"
 __copyright__ = "Copyright (c) 2013 " + __author__
 """
     violations = _check(source, level=level)
-    assert all("'__author__'" not in v.message for v in violations)
+    assert "__author__" not in _flagged_names(violations)
 
 
 def test_multiple_assignment_targets_not_tracked() -> None:
@@ -1102,9 +1096,7 @@ def func():
 """
     violations = _check(source)
     # Multiple assignment targets are skipped entirely.
-    assert all("'a'" not in v.message for v in violations)
-    assert all("'b'" not in v.message for v in violations)
-    assert all("'c'" not in v.message for v in violations)
+    assert _flagged_names(violations).isdisjoint({"a", "b", "c"})
 
 
 @pytest.mark.parametrize(
@@ -1198,7 +1190,7 @@ def func(ctx_factory):
 )
 def test_untracked_rebinding_not_flagged_as_redundant(source: str, excluded_names: tuple[str, ...]) -> None:
     violations = _check(source, level=AggressivenessLevel.PERMISSIVE)
-    assert all(f"'{name}'" not in v.message for v in violations for name in excluded_names)
+    assert _flagged_names(violations).isdisjoint(excluded_names)
 
 
 def test_ignore_marker_inside_string_literal_does_not_suppress_violation() -> None:
@@ -1224,9 +1216,8 @@ def process_data():
     x = "foo"
     return x
 """
-    violations = _check(source, "src/processor.py")
-    assert len(violations) > 0
-    assert any("x" in v.message for v in violations)
+    violations = _check(source, Path("src/processor.py"))
+    assert "x" in _flagged_names(violations)
 
 
 # ---------------------------------------------------------------------------
@@ -1321,12 +1312,7 @@ def test_check_reports_flagged_violation(source: str, substring: str | None) ->
 
 
 def test_immediate_single_use_detected() -> None:
-    source = """
-def func_scope():
-    x = "foo"
-    func(x=x)
-"""
-    violations = _check(source)
+    violations = _check(_SRC_FUNC_SCOPE_SINGLE_USE)
 
     assert len(violations) >= 1
     violation = violations[0]
@@ -1349,12 +1335,7 @@ def example():
 
 
 def test_fixable_marked_correctly() -> None:
-    source = """
-def func_scope():
-    x = "foo"
-    func(x=x)
-"""
-    violations = _check(source)
+    violations = _check(_SRC_FUNC_SCOPE_SINGLE_USE)
     # Simple case: constant assignment, immediate use, short name, no
     # control flow.
     assert any(v.fixable for v in violations)
@@ -1430,8 +1411,7 @@ def example():
 """
     violations = _check(source)
     assert violations
-    for v in violations:
-        assert not v.fixable
+    assert all(not v.fixable for v in violations)
 
 
 def test_autofix_only_simple_rhs() -> None:
@@ -1445,8 +1425,7 @@ def example():
 """
     violations = _check(source)
     assert violations
-    for v in violations:
-        assert not v.fixable
+    assert all(not v.fixable for v in violations)
 
 
 def test_async_with_body_assignment_flagged_but_not_fixable() -> None:
@@ -21,13 +21,14 @@ from pre_commit_hooks.ast_checks.redundant_assignment.semantic import (
     calculate_semantic_value,
     should_autofix,
 )
+from tests.redundant_assignment._helpers import _parse_expr
 
 
 def _make_single_use_lifecycle(
     rhs_source: str,
-    rhs_node: ast.expr,
     var_name: str = "x",
     *,
+    rhs_node: ast.expr | None = None,
     in_loop: bool = False,
     in_control_flow: bool = False,
     preceded_by_call: bool = False,
@@ -39,13 +40,14 @@ def _make_single_use_lifecycle(
     consistent tree: `{var_name}.method()` when preceded_by_call is False
     (var_name is the first thing evaluated), or
     `sink(side_effect(), {var_name})` when True (a sibling call precedes it).
+    `rhs_node` defaults to `rhs_source` parsed as an expression.
     """
     assignment = AssignmentInfo(
         var_name=var_name,
         line=1,
         col=0,
         stmt_index=0,
-        rhs_node=rhs_node,
+        rhs_node=rhs_node if rhs_node is not None else _parse_expr(rhs_source),
         rhs_source=rhs_source,
         scope_id=1,
         has_type_annotation=False,
@@ -71,21 +73,24 @@ def _make_single_use_lifecycle(
     return VariableLifecycle(assignment=assignment, uses=[use])
 
 
-def _lifecycle_no_node(rhs_source: str, var_name: str = "x") -> VariableLifecycle:
-    """A lifecycle whose use has no real AST node attached (unknown context)."""
-    rhs_node = ast.parse(rhs_source, mode="eval").body
-    assignment = AssignmentInfo(
+def _top_assignment(rhs_source: str, var_name: str) -> AssignmentInfo:
+    """`{var_name} = {rhs_source}` as the first statement of scope 0."""
+    return AssignmentInfo(
         var_name=var_name,
         line=1,
         col=0,
         stmt_index=0,
-        rhs_node=rhs_node,
+        rhs_node=_parse_expr(rhs_source),
         rhs_source=rhs_source,
         scope_id=0,
         has_type_annotation=False,
     )
+
+
+def _lifecycle_no_node(rhs_source: str, var_name: str = "x") -> VariableLifecycle:
+    """A lifecycle whose use has no real AST node attached (unknown context)."""
     return VariableLifecycle(
-        assignment=assignment,
+        assignment=_top_assignment(rhs_source, var_name),
         uses=[UsageInfo(var_name=var_name, line=2, col=0, stmt_index=1, context="unknown", scope_id=0)],
     )
 
@@ -100,23 +105,12 @@ def _lifecycle_with_use_node(
     # non-immediate use pass a larger value explicitly.
     use_stmt_index: int = 1,
 ) -> VariableLifecycle:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
-    assignment = AssignmentInfo(
-        var_name=var_name,
-        line=1,
-        col=0,
-        stmt_index=0,
-        rhs_node=rhs_node,
-        rhs_source=rhs_source,
-        scope_id=0,
-        has_type_annotation=False,
-    )
     use_stmt = ast.parse(use_stmt_source).body[0]
     use_node = next(
         n for n in ast.walk(use_stmt) if isinstance(n, ast.Name) and n.id == var_name and isinstance(n.ctx, ast.Load)
     )
     return VariableLifecycle(
-        assignment=assignment,
+        assignment=_top_assignment(rhs_source, var_name),
         uses=[
             UsageInfo(
                 var_name=var_name,
@@ -197,50 +191,48 @@ def test_should_autofix_rejects_non_immediate_attribute_or_call_use(rhs_source:
 
 
 def test_should_autofix_returns_false_for_loop_assignment() -> None:
-    rhs_node = ast.parse('"foo"', mode="eval").body
-    lifecycle = _make_single_use_lifecycle('"foo"', rhs_node, in_loop=True)
+    lifecycle = _make_single_use_lifecycle('"foo"', in_loop=True)
     assert should_autofix(lifecycle) is False
 
 
 def test_should_autofix_returns_false_for_multiline_rhs() -> None:
-    rhs_node = ast.parse('"foo"', mode="eval").body
-    lifecycle = _make_single_use_lifecycle('"foo"\n"bar"', rhs_node)
-    assert should_autofix(lifecycle) is False
-
-
-def test_should_autofix_allows_long_var_name_when_line_length_is_fine() -> None:
-    # Issue #76: the old var-name-length > 10 guard was only ever a crude
-    # proxy for "inlining might push the line too long" — now superseded
-    # entirely by the real line-length check below (with the actual use
-    # line, or the RHS-length estimate as a fallback), so a long name on
-    # its own is no longer disqualifying.
-    rhs_node = ast.parse("something1", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("something1", rhs_node, var_name="myvariablex")
-    assert should_autofix(lifecycle) is True
-
-
-def test_should_autofix_returns_true_for_single_use_constant_rhs() -> None:
-    rhs_node = ast.parse("42", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("42", rhs_node, var_name="x")
-    assert should_autofix(lifecycle) is True
-
-
-def test_should_autofix_returns_false_for_non_call_non_attr_rhs() -> None:
-    # A list literal falls through every isinstance check and reaches the
-    # final ``return False``.
-    rhs_node = ast.parse("[1, 2, 3]", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("[1, 2, 3]", rhs_node)
+    # Two implicitly concatenated lines don't parse as one eval-mode
+    # expression, so the node is supplied explicitly.
+    lifecycle = _make_single_use_lifecycle('"foo"\n"bar"', rhs_node=_parse_expr('"foo"'))
     assert should_autofix(lifecycle) is False
 
 
-def test_should_autofix_allows_zero_arg_call() -> None:
-    # Issue #22 gap 2 (now generalized by issue #76 to every pattern, not
-    # just SINGLE_USE): a zero-arg call with nothing else evaluating
-    # before its use (within the use's statement) has no sibling operand
-    # whose order inlining could disturb, so it's safe to inline.
-    rhs_node = ast.parse("ForbidVarsCheck()", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("ForbidVarsCheck()", rhs_node, var_name="check", preceded_by_call=False)
-    assert should_autofix(lifecycle) is True
+@pytest.mark.parametrize(
+    ("rhs_source", "var_name", "expected"),
+    [
+        # Issue #76: the old var-name-length > 10 guard was only ever a
+        # crude proxy for "inlining might push the line too long" — now
+        # superseded entirely by the real line-length check (with the
+        # actual use line, or the RHS-length estimate as a fallback), so a
+        # long name on its own is no longer disqualifying.
+        ("something1", "myvariablex", True),
+        ("42", "x", True),
+        # A list literal falls through every isinstance check and reaches
+        # the final ``return False``.
+        ("[1, 2, 3]", "x", False),
+        # Issue #22 gap 2 (now generalized by issue #76 to every pattern,
+        # not just SINGLE_USE): a zero-arg call with nothing else
+        # evaluating before its use (within the use's statement) has no
+        # sibling operand whose order inlining could disturb, so it's safe
+        # to inline.
+        ("ForbidVarsCheck()", "check", True),
+        # Issue #76: autofix eligibility is no longer pattern-dependent — a
+        # call with a single simple argument used to be rejected whenever
+        # the pattern was IMMEDIATE_SINGLE_USE/LITERAL_IDENTITY (only a bare
+        # zero-arg carve-out was allowed there); the same ≤2-arg allowance
+        # SINGLE_USE already had now applies uniformly.
+        ("make_check(1)", "check", True),
+    ],
+    ids=["long-var-name", "constant", "list-literal", "zero-arg-call", "one-arg-call"],
+)
+def test_should_autofix_single_use(rhs_source: str, var_name: str, *, expected: bool) -> None:
+    lifecycle = _make_single_use_lifecycle(rhs_source, var_name)
+    assert should_autofix(lifecycle) is expected
 
 
 def test_should_autofix_rejects_zero_arg_call_preceded_by_a_call() -> None:
@@ -251,30 +243,17 @@ def test_should_autofix_rejects_zero_arg_call_preceded_by_a_call() -> None:
     # sink(side_effect(), value)` must not become `sink(side_effect(),
     # next_value())` — that runs next_value() after side_effect() instead
     # of before it.
-    rhs_node = ast.parse("next_value()", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("next_value()", rhs_node, var_name="value", preceded_by_call=True)
+    lifecycle = _make_single_use_lifecycle("next_value()", var_name="value", preceded_by_call=True)
     assert should_autofix(lifecycle) is False
 
 
-def test_should_autofix_allows_call_with_one_arg() -> None:
-    # Issue #76: autofix eligibility is no longer pattern-dependent — a
-    # call with a single simple argument used to be rejected whenever the
-    # pattern was IMMEDIATE_SINGLE_USE/LITERAL_IDENTITY (only a bare
-    # zero-arg carve-out was allowed there); the same ≤2-arg allowance
-    # SINGLE_USE already had now applies uniformly.
-    rhs_node = ast.parse("make_check(1)", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("make_check(1)", rhs_node, var_name="check")
-    assert should_autofix(lifecycle) is True
-
-
 def test_should_autofix_uses_real_use_line_length_when_available() -> None:
     # Issue #22 gap 1: should_autofix's line-length check must reflect the
     # *actual* use line when the caller can supply it, not just the
     # conservative RHS/var-name-based estimate — otherwise a violation can
     # be reported [FIXABLE] and then silently skipped by apply_fixes' own,
     # accurate length check.
-    rhs_node = ast.parse("ast.parse(source)", mode="eval").body
-    lifecycle = _make_single_use_lifecycle("ast.parse(source)", rhs_node, var_name="tree")
+    lifecycle = _make_single_use_lifecycle("ast.parse(source)", var_name="tree")
 
     # Without the real use line, the conservative RHS/var-name estimate
     # says inlining is safe (both are short).
@@ -317,7 +296,7 @@ def test_should_autofix_uses_real_use_line_length_when_available() -> None:
     ],
 )
 def test_is_generic_call_result_name(var_name: str, rhs_source: str, *, expected: bool) -> None:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert isinstance(rhs_node, ast.Call)
     assert _is_generic_call_result_name(var_name, rhs_node) is expected
 
@@ -361,7 +340,7 @@ def test_is_generic_call_result_name(var_name: str, rhs_source: str, *, expected
     ],
 )
 def test_calculate_semantic_value_at_least(var_name: str, rhs_source: str, minimum: int) -> None:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert calculate_semantic_value(var_name, rhs_source, rhs_node, has_type_annotation=False) >= minimum
 
 
@@ -378,13 +357,13 @@ def test_calculate_semantic_value_at_least(var_name: str, rhs_source: str, minim
     ids=["two-subscript-chains", "three-plus-chains-with-multipart-name", "name-moderately-longer-than-rhs"],
 )
 def test_calculate_semantic_value_exact(var_name: str, rhs_source: str, expected: int) -> None:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert calculate_semantic_value(var_name, rhs_source, rhs_node, has_type_annotation=False) == expected
 
 
 def test_calculate_semantic_value_chained_attributes() -> None:
     rhs_source = "obj.foo.bar"
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert calculate_semantic_value("result", rhs_source, rhs_node, has_type_annotation=False) >= 20
 
 
@@ -412,7 +391,7 @@ def test_calculate_semantic_value_chained_attributes() -> None:
     ],
 )
 def test_calculate_semantic_value_test_context(var_name: str, rhs_source: str, minimum: int) -> None:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert (
         calculate_semantic_value(var_name, rhs_source, rhs_node, has_type_annotation=False, is_test_context=True)
         >= minimum
@@ -467,7 +446,7 @@ def test_calculate_semantic_value_test_context(var_name: str, rhs_source: str, m
     ],
 )
 def test_adds_verbosity_or_context(var_name: str, rhs_source: str, *, expected: bool) -> None:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert _adds_verbosity_or_context(var_name, rhs_source, rhs_node) is expected
 
 
@@ -487,7 +466,7 @@ def test_adds_verbosity_or_context(var_name: str, rhs_source: str, *, expected:
     ids=["binop", "boolop", "compare", "simple-call"],
 )
 def test_would_require_parentheses(rhs_source: str, *, expected: bool) -> None:
-    rhs_node = ast.parse(rhs_source, mode="eval").body
+    rhs_node = _parse_expr(rhs_source)
     assert _would_require_parentheses(rhs_node) is expected
 
 
@@ -509,7 +488,7 @@ def test_would_require_parentheses(rhs_source: str, *, expected: bool) -> None:
     ids=["multipart-int", "float", "single-part-long-name", "generic-value", "generic-num", "non-numeric"],
 )
 def test_is_named_constant_pattern(var_name: str, rhs_source: str, *, expected: bool) -> None:
-    node = ast.parse(rhs_source, mode="eval").body
+    node = _parse_expr(rhs_source)
     assert _is_named_constant_pattern(var_name, node) is expected
 
 
@@ -538,7 +517,7 @@ def test_is_named_constant_pattern(var_name: str, rhs_source: str, *, expected:
     ],
 )
 def test_is_named_string_constant_pattern(var_name: str, rhs_source: str, *, expected: bool) -> None:
-    node = ast.parse(rhs_source, mode="eval").body
+    node = _parse_expr(rhs_source)
     assert _is_named_string_constant_pattern(var_name, node) is expected
 
 
@@ -590,5 +569,5 @@ def test_contains_nondeterministic_call_with_subscript_func() -> None:
     # (e.g. ``funcs[0]()``), ``node.func`` is neither Name nor Attribute.
     # The detector must continue visiting child nodes rather than crashing
     # or silently skipping.
-    rhs_node = ast.parse("funcs[0]()", mode="eval").body
+    rhs_node = _parse_expr("funcs[0]()")
     assert _contains_nondeterministic_call(rhs_node) is False
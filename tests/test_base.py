@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ast
 import stat
+import tokenize
 from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
@@ -53,6 +54,8 @@ def test_byte_col_to_char_col(line: str, needle: bytes) -> None:
         "x = compute(1, 2)\n",
         "café = compute(x)  # café\n",
         "x = (\n    1 +\n    2\n)\n",
+        "x = f(\r\n    'café',\r\n    2)\r\n",
+        "x = (\r    1 +\r    2)\r",
         "x = [1, 2, 3][0]\n",
         "x = 1",
         # A raw form-feed byte is legal intra-line whitespace to Python's
@@ -67,6 +70,8 @@ def test_byte_col_to_char_col(line: str, needle: bytes) -> None:
         "single-line",
         "unicode-before-node",
         "multiline-parenthesized",
+        "multiline-crlf-with-unicode",
+        "multiline-cr-only",
         "single-line-subscript",
         "no-trailing-newline",
         "form-feed-inside-single-line-node",
@@ -76,7 +81,7 @@ def test_fast_get_source_segment_matches_ast_get_source_segment(source: str) ->
     tree = ast.parse(source)
     assign = next(node for node in ast.walk(tree) if isinstance(node, ast.Assign))
 
-    fast_result = fast_get_source_segment(source, split_lines_like_ast(source), assign.value)
+    fast_result = fast_get_source_segment(split_lines_like_ast(source), assign.value)
 
     assert fast_result == ast.get_source_segment(source, assign.value)
 
@@ -87,7 +92,7 @@ def test_fast_get_source_segment_returns_none_without_end_position() -> None:
     assign = next(node for node in ast.walk(tree) if isinstance(node, ast.Assign))
     assign.value.end_lineno = None
 
-    assert fast_get_source_segment(source, split_lines_like_ast(source), assign.value) is None
+    assert fast_get_source_segment(split_lines_like_ast(source), assign.value) is None
 
 
 @pytest.mark.parametrize(
@@ -183,6 +188,14 @@ def test_find_ignored_lines_on_cr_only_source() -> None:
     assert find_ignored_lines(source, ignore_pattern_for("TRI001")) == {2}
 
 
+def test_find_ignored_lines_skips_tokenizing_without_marker(monkeypatch: pytest.MonkeyPatch) -> None:
+    def boom(*_args: object) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(tokenize, "generate_tokens", boom)
+    assert find_ignored_lines("x = 1  # pytriage: ignore=TRI002\n", ignore_pattern_for("TRI001")) == set()
+
+
 def _setup_plain(tmp_path: Path) -> Path:
     target = tmp_path / "mod.py"
     target.write_text("old\n")
@@ -12,11 +12,12 @@ from pre_commit_hooks.ast_checks.excessive_blank_lines import (
 )
 from tests.factories import ViolationFactory
 
+_FAKE_PATH = Path("test.py")
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "excessive_blank_lines"
 
 
 def _check(source: str) -> list[str]:
-    violations = ExcessiveBlankLinesCheck().check(Path("test.py"), ast.parse(source), source)
+    violations = ExcessiveBlankLinesCheck().check(_FAKE_PATH, ast.parse(source), source)
     return [v.message for v in violations]
 
 
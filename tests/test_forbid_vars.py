@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import ast
-import tempfile
 import typing
 from pathlib import Path
 from typing import Any
@@ -17,6 +16,8 @@ from pre_commit_hooks.ast_checks.forbid_vars import (
     _function_name_describes_parameter,
 )
 
+_FAKE_PATH = Path("test.py")
+
 
 @pytest.mark.parametrize(
     "source",
@@ -152,7 +153,7 @@ def feed_data(
     ],
 )
 def test_check_reports_no_violations(source: str) -> None:
-    assert ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source) == []
+    assert ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source) == []
 
 
 @pytest.mark.parametrize(
@@ -358,7 +359,7 @@ def handle(self, data: Union[bytes, bytearray, memoryview]) -> Tuple[bool, bytes
     ],
 )
 def test_check_reports_single_violation(source: str, expected: dict[str, Any]) -> None:
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 1
     violation = violations[0]
@@ -399,7 +400,7 @@ result = None  # Should be flagged
     ids=["module-level-variables", "nested-function-scope-flagged-separately"],
 )
 def test_check_reports_violation_count(source: str, count: int) -> None:
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
     assert len(violations) == count
 
 
@@ -411,7 +412,7 @@ def process():
     return data, result
 """
 
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 2
     names = {v.message.split("'")[1] for v in violations}
@@ -425,7 +426,7 @@ def test_multiple_violations_same_scope() -> None:
     return result
 """
 
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 2
     names = {v.fix_data["name"] for v in violations if v.fix_data}
@@ -440,7 +441,7 @@ def test_reassignment_suppresses_suggestions() -> None:
     return data
 """
 
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 2
     assert all(not violation.fixable for violation in violations)
@@ -465,14 +466,14 @@ def test_model_validator_decorator_skips_arg_check() -> None:
         return data
 """
 
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     flagged_functions = {v.fix_data["name"] for v in violations if v.fix_data}
     assert flagged_functions == {"data"}
     assert len(violations) == 1
 
 
-def test_name_collision_suppresses_suggestion() -> None:
+def test_name_collision_suppresses_suggestion(tmp_path: Path) -> None:
     source = """def process():
     response = 1
     response_2 = 2
@@ -480,23 +481,22 @@ def test_name_collision_suppresses_suggestion() -> None:
     return data
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(filepath, ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(filepath, ast.parse(source), source)
 
-        assert len(violations) == 1
-        assert not violations[0].fixable
-        assert violations[0].fix_data is not None
-        assert violations[0].fix_data["suggestion"] is None
+    assert len(violations) == 1
+    assert not violations[0].fixable
+    assert violations[0].fix_data is not None
+    assert violations[0].fix_data["suggestion"] is None
 
 
 def test_tokenize_error_handling() -> None:
     # Deliberately malformed so tokenizing may raise partway through.
     source = "def func():\n    data = 1  # missing closing quote"
 
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) >= 1
 
@@ -534,7 +534,7 @@ def test_function_name_describes_parameter(function_name: str, parameter_name: s
     assert _function_name_describes_parameter(function_name, parameter_name) is expected
 
 
-def test_autofix_applies_suggestions() -> None:
+def test_autofix_applies_suggestions(tmp_path: Path) -> None:
     source = """import requests
 
 def fetch_users():
@@ -542,46 +542,44 @@ def fetch_users():
     return data.status_code
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
 
-        assert len(violations) == 1
-        assert violations[0].fixable
+    assert len(violations) == 1
+    assert violations[0].fixable
 
-        success = check.fix(filepath, violations, source, tree)
-        assert success
+    success = check.fix(filepath, violations, source, tree)
+    assert success
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
-        assert "data" not in fixed_content
-        assert "return response.status_code" in fixed_content
+    assert "data" not in fixed_content
+    assert "return response.status_code" in fixed_content
 
 
-def test_autofix_no_fixable_violations() -> None:
+def test_autofix_no_fixable_violations(tmp_path: Path) -> None:
     source = """def process():
     data = {}  # No autofix suggestion available
     return data
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        non_fixable = [v for v in violations if not v.fixable]
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    non_fixable = [v for v in violations if not v.fixable]
 
-        success = check.fix(filepath, non_fixable, source, tree)
-        assert not success
+    success = check.fix(filepath, non_fixable, source, tree)
+    assert not success
 
 
-def test_autofix_follows_closure_reference_into_nested_function() -> None:
+def test_autofix_follows_closure_reference_into_nested_function(tmp_path: Path) -> None:
     # Regression: renaming only the assignment while leaving a nested
     # function's free-variable reference untouched used to leave the
     # closure reading a name that no longer exists in its enclosing scope
@@ -596,16 +594,15 @@ def test_autofix_follows_closure_reference_into_nested_function() -> None:
 
     return inner()
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     module_namespace: dict[str, Any] = {}
@@ -621,47 +618,45 @@ def test_autofix_follows_closure_reference_into_nested_function() -> None:
     assert module_namespace["outer"](FakeResponse()) == {"k": "v"}
 
 
-def test_autofix_follows_closure_reference_into_lambda() -> None:
+def test_autofix_follows_closure_reference_into_lambda(tmp_path: Path) -> None:
     source = """def outer(response):
     data: Payload = response.json()
     return lambda: data
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     assert "return lambda: payload" in fixed_content
 
 
-def test_autofix_follows_closure_reference_into_comprehension() -> None:
+def test_autofix_follows_closure_reference_into_comprehension(tmp_path: Path) -> None:
     source = """def outer(response, items):
     data: Payload = response.json()
     return [str(data) for _ in items]
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     ast.parse(fixed_content)  # Must still be valid Python.
 
 
-def test_walrus_rebinding_suppresses_suggestion() -> None:
+def test_walrus_rebinding_suppresses_suggestion(tmp_path: Path) -> None:
     # Regression: PEP 572 binds a `:=` target inside a comprehension to the
     # nearest *enclosing* non-comprehension scope, not the comprehension
     # itself — so a walrus target sharing the outer variable's name is the
@@ -675,16 +670,15 @@ def test_walrus_rebinding_suppresses_suggestion() -> None:
     data: Payload = response.json()
     return [(data := item) for item in items], data
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
@@ -807,17 +801,18 @@ def test_walrus_rebinding_suppresses_suggestion() -> None:
         "type-params-no-return-annotation",
     ],
 )
-def test_autofix_renames_reference_evaluated_in_enclosing_scope(source: str, expected_snippet: str) -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+def test_autofix_renames_reference_evaluated_in_enclosing_scope(
+    tmp_path: Path, source: str, expected_snippet: str
+) -> None:
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert expected_snippet in fixed_content
     ast.parse(fixed_content)  # Must still be valid Python.
@@ -1029,17 +1024,18 @@ def test_autofix_renames_reference_evaluated_in_enclosing_scope(source: str, exp
         "from-import",
     ],
 )
-def test_autofix_does_not_rename_shadowed_reference_in_nested_scope(source: str, shadowed_snippet: str) -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+def test_autofix_does_not_rename_shadowed_reference_in_nested_scope(
+    tmp_path: Path, source: str, shadowed_snippet: str
+) -> None:
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert shadowed_snippet in fixed_content
     # The outer occurrence (the trailing `, data` in every case above) must
@@ -1048,7 +1044,7 @@ def test_autofix_does_not_rename_shadowed_reference_in_nested_scope(source: str,
     assert "payload" in fixed_content
 
 
-def test_autofix_never_offered_for_name_referenced_via_nonlocal() -> None:
+def test_autofix_never_offered_for_name_referenced_via_nonlocal(tmp_path: Path) -> None:
     # A nested function's `nonlocal data` declaration means its own `data =
     # "mutated"` Store isn't a shadowing local binding — it mutates the
     # *outer* variable directly. Renaming the outer variable but leaving
@@ -1071,19 +1067,18 @@ def test_autofix_never_offered_for_name_referenced_via_nonlocal() -> None:
     inner()
     return data
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert violations
-        assert all(not v.fixable for v in violations)
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert violations
+    assert all(not v.fixable for v in violations)
 
-        assert check.fix(filepath, violations, source, tree) is False
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
     ast.parse(fixed_content)  # Left untouched, so it's still valid Python.
@@ -1208,26 +1203,25 @@ def test_autofix_never_offered_for_name_referenced_via_nonlocal() -> None:
         "same-scope-from-import",
     ],
 )
-def test_autofix_never_offered_when_same_scope_rebinds_via_non_name_construct(source: str) -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+def test_autofix_never_offered_when_same_scope_rebinds_via_non_name_construct(tmp_path: Path, source: str) -> None:
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert violations
-        assert all(not v.fixable for v in violations)
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert violations
+    assert all(not v.fixable for v in violations)
 
-        assert check.fix(filepath, violations, source, tree) is False
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
     ast.parse(fixed_content)  # Left untouched, so it's still valid Python.
 
 
-def test_autofix_never_offered_for_module_global_read_in_function() -> None:
+def test_autofix_never_offered_for_module_global_read_in_function(tmp_path: Path) -> None:
     # Regression: a module-level `data` read via `global data` inside a
     # function isn't a *new* binding at all — it's the same variable being
     # renamed. `_binds_name_in_nested_scope` used to treat `global data` as
@@ -1253,23 +1247,22 @@ def reader():
     global data
     return data
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert violations
-        assert all(not v.fixable for v in violations)
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert violations
+    assert all(not v.fixable for v in violations)
 
-        check.fix(filepath, violations, source, tree)
-        fixed_content = filepath.read_text()
+    check.fix(filepath, violations, source, tree)
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_avoids_cross_scope_suggestion_collision() -> None:
+def test_autofix_avoids_cross_scope_suggestion_collision(tmp_path: Path) -> None:
     # Regression: two *independent* violations in different (but nested,
     # non-shadowing) scopes that happen to generate the same suggested
     # name used to both become that name, colliding once the outer one's
@@ -1286,21 +1279,20 @@ def test_autofix_avoids_cross_scope_suggestion_collision() -> None:
 
     return inner(response)
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_avoids_suggestion_colliding_with_existing_nested_name() -> None:
+def test_autofix_avoids_suggestion_colliding_with_existing_nested_name(tmp_path: Path) -> None:
     # Branch coverage / regression: _get_scope_names() now walks the
     # *entire* subtree (not just the immediate scope) so a suggestion also
     # avoids an already-existing identifier that lives in a nested scope,
@@ -1314,21 +1306,20 @@ def test_autofix_avoids_suggestion_colliding_with_existing_nested_name() -> None
 
     return inner()
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_avoids_suggestion_colliding_with_nested_parameter_name() -> None:
+def test_autofix_avoids_suggestion_colliding_with_nested_parameter_name(tmp_path: Path) -> None:
     # Regression: _get_scope_names() must also see *parameter* names (never
     # `ast.Name` nodes), not just already-bound locals, or a suggestion can
     # collide with a nested function's own parameter and silently rebind a
@@ -1341,21 +1332,20 @@ def test_autofix_avoids_suggestion_colliding_with_nested_parameter_name() -> Non
 
     return inner(5)
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_avoids_suggestion_colliding_with_nested_global_declaration() -> None:
+def test_autofix_avoids_suggestion_colliding_with_nested_global_declaration(tmp_path: Path) -> None:
     # Regression: a name declared `global`/`nonlocal` in a nested scope is
     # stored as a plain string (`ast.Global.names`), never an `ast.Name`
     # node, so `_get_scope_names()` didn't see it as reserved. A suggestion
@@ -1373,21 +1363,20 @@ def outer(response):
 
     return inner()
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_renames_walrus_target_inside_default_evaluated_in_enclosing_scope() -> None:
+def test_autofix_renames_walrus_target_inside_default_evaluated_in_enclosing_scope(tmp_path: Path) -> None:
     # Regression: `_binds_name_in_nested_scope()` must scan only the nested
     # function's *own* scope, not its `_outer_scope_children()` (decorators,
     # defaults, annotations without type params) — those run in the
@@ -1403,16 +1392,15 @@ def test_autofix_renames_walrus_target_inside_default_evaluated_in_enclosing_sco
 
     return inner()
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     module_namespace: dict[str, Any] = {}
@@ -1425,7 +1413,7 @@ def test_autofix_renames_walrus_target_inside_default_evaluated_in_enclosing_sco
     assert module_namespace["outer"](FakeResponse()) == ("value", "value")
 
 
-def test_autofix_follows_closure_through_scope_that_itself_contains_a_shadowing_nested_scope() -> None:
+def test_autofix_follows_closure_through_scope_that_itself_contains_a_shadowing_nested_scope(tmp_path: Path) -> None:
     # Regression: `_binds_name_in_nested_scope()` must not descend into a
     # *further*-nested function/lambda/comprehension when checking whether
     # the scope it was actually asked about binds the name. `middle` itself
@@ -1445,16 +1433,15 @@ def test_autofix_follows_closure_through_scope_that_itself_contains_a_shadowing_
 
     return middle()
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "def deeper():\n            data = " in fixed_content  # deeper's own local, untouched
     module_namespace: dict[str, Any] = {}
@@ -1467,7 +1454,7 @@ def test_autofix_follows_closure_through_scope_that_itself_contains_a_shadowing_
     assert module_namespace["outer"](FakeResponse()) == ("closure value", "unrelated local")
 
 
-def test_autofix_avoids_suggestion_collision_when_nested_closure_precedes_captured_assignment() -> None:
+def test_autofix_avoids_suggestion_collision_when_nested_closure_precedes_captured_assignment(tmp_path: Path) -> None:
     # Regression: suggestions used to be assigned in AST visit (textual)
     # order, so a nested closure defined *before* the outer variable it
     # will eventually capture (valid Python — closures resolve names at
@@ -1484,21 +1471,20 @@ def test_autofix_avoids_suggestion_collision_when_nested_closure_precedes_captur
     data: Payload = response.json()
     return inner()
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_does_not_rename_annotation_under_deferred_annotations() -> None:
+def test_autofix_does_not_rename_annotation_under_deferred_annotations(tmp_path: Path) -> None:
     # Regression: with `from __future__ import annotations` (PEP 563)
     # active, every annotation is stored as a string and resolved later
     # against the function's *module* globals, never the enclosing
@@ -1519,16 +1505,15 @@ def outer(response):
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "def inner(x: data):" in fixed_content  # annotation untouched
     module_namespace: dict[str, Any] = {}
@@ -1543,7 +1528,7 @@ def outer(response):
     assert hints == {"x": int}
 
 
-def test_autofix_still_follows_annotation_closure_without_deferred_annotations() -> None:
+def test_autofix_still_follows_annotation_closure_without_deferred_annotations(tmp_path: Path) -> None:
     # Without `from __future__ import annotations`, a parameter annotation
     # *is* evaluated eagerly in the enclosing scope (like a default value),
     # so it must still be renamed to follow the closure it actually reads —
@@ -1557,16 +1542,15 @@ def test_autofix_still_follows_annotation_closure_without_deferred_annotations()
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     assert "def inner(x: payload):" in fixed_content
@@ -1617,7 +1601,7 @@ result = response.json()
 def f(x: data) -> result:
     return x
 """
-    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), ast.parse(source), source)
+    violations = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 2
     assert all(
@@ -1627,7 +1611,7 @@ def f(x: data) -> result:
     assert all(violation.fixable is False for violation in violations)
 
 
-def test_autofix_follows_closure_into_type_parameter_bound_and_default() -> None:
+def test_autofix_follows_closure_into_type_parameter_bound_and_default(tmp_path: Path) -> None:
     # Regression: a PEP 695 type parameter's own `bound`/`default_value`
     # expression is evaluated lazily, but through a real closure over the
     # scope enclosing the `def` — confirmed against CPython to respect
@@ -1649,16 +1633,15 @@ def test_autofix_follows_closure_into_type_parameter_bound_and_default() -> None
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     assert "def inner[**Q, T: payload = payload, *Ts = payload, **P = payload]():" in fixed_content
@@ -1677,7 +1660,7 @@ def test_autofix_follows_closure_into_type_parameter_bound_and_default() -> None
     assert param_spec.__default__ == "runtime value"
 
 
-def test_autofix_does_not_rename_type_parameter_bound_referencing_a_peer_type_parameter() -> None:
+def test_autofix_does_not_rename_type_parameter_bound_referencing_a_peer_type_parameter(tmp_path: Path) -> None:
     # Regression: within one `type_params` list, a *later* type parameter's
     # own bound/default expression can reference an *earlier* type
     # parameter by name — confirmed against CPython that this resolves to
@@ -1694,16 +1677,15 @@ def test_autofix_does_not_rename_type_parameter_bound_referencing_a_peer_type_pa
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "def inner[data, T: data]():" in fixed_content
     module_namespace: dict[str, Any] = {}
@@ -1718,7 +1700,7 @@ def test_autofix_does_not_rename_type_parameter_bound_referencing_a_peer_type_pa
     assert type_var.__bound__ is peer_type_var
 
 
-def test_autofix_does_not_reuse_a_nested_functions_own_mapping_for_its_default() -> None:
+def test_autofix_does_not_reuse_a_nested_functions_own_mapping_for_its_default(tmp_path: Path) -> None:
     # Regression: a parameter default is evaluated in the *enclosing* scope,
     # not the function it belongs to — `_collect_scope_replacements()` (the
     # entry point used when a violation's own enclosing scope is the nested
@@ -1738,16 +1720,15 @@ def test_autofix_does_not_reuse_a_nested_functions_own_mapping_for_its_default()
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     assert "def inner(x=payload):" in fixed_content
@@ -1763,7 +1744,7 @@ def test_autofix_does_not_reuse_a_nested_functions_own_mapping_for_its_default()
     assert inner() == ("runtime value", "runtime value")
 
 
-def test_autofix_does_not_rename_a_nested_functions_own_type_parameter_bound_via_its_own_scope() -> None:
+def test_autofix_does_not_rename_a_nested_functions_own_type_parameter_bound_via_its_own_scope(tmp_path: Path) -> None:
     # Regression: same root cause as the test above, but reached through
     # `inner`'s own type parameter bound instead of a default — the
     # violation here is `data`'s reassignment inside `inner`'s own body, so
@@ -1779,21 +1760,20 @@ def test_autofix_does_not_rename_a_nested_functions_own_type_parameter_bound_via
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is False
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is False
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_does_not_rename_type_alias_bound_referencing_a_peer_type_parameter() -> None:
+def test_autofix_does_not_rename_type_alias_bound_referencing_a_peer_type_parameter(tmp_path: Path) -> None:
     # Regression: a PEP 695 `type` alias statement (`ast.TypeAlias`) has its
     # own implicit type-parameter scope, exactly like a generic function —
     # confirmed against CPython that a later type parameter's own bound can
@@ -1809,16 +1789,15 @@ def test_autofix_does_not_rename_type_alias_bound_referencing_a_peer_type_parame
 
     return Alias
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "type Alias[data, T: data] = T" in fixed_content
     assert "payload: Payload = response.json()" in fixed_content
@@ -1834,7 +1813,7 @@ def test_autofix_does_not_rename_type_alias_bound_referencing_a_peer_type_parame
     assert type_var_t.__bound__ is peer_data
 
 
-def test_autofix_follows_closure_into_type_alias_value() -> None:
+def test_autofix_follows_closure_into_type_alias_value(tmp_path: Path) -> None:
     # A `type` alias's own `value` expression is lazily evaluated but still
     # closes over its enclosing scope for any name that isn't one of its own
     # peer type parameters — confirmed against CPython. Covers the other
@@ -1851,16 +1830,15 @@ def test_autofix_follows_closure_into_type_alias_value() -> None:
 
     return Alias
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     assert "type Alias[T: int] = tuple[T, payload]" in fixed_content
@@ -1878,7 +1856,7 @@ def test_autofix_follows_closure_into_type_alias_value() -> None:
     assert typing.get_args(alias.__value__) == (type_var_t, "runtime value")
 
 
-def test_autofix_follows_closure_into_generic_functions_own_annotation_despite_body_shadowing() -> None:
+def test_autofix_follows_closure_into_generic_functions_own_annotation_despite_body_shadowing(tmp_path: Path) -> None:
     # Regression: a PEP 695 generic function's parameter/return annotations
     # run in the type parameters' own implicit scope, not the function's own
     # body/parameter scope — confirmed against CPython that a body-local
@@ -1899,16 +1877,15 @@ def test_autofix_follows_closure_into_generic_functions_own_annotation_despite_b
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "def inner[T](value: payload):" in fixed_content
     assert "data = 1" in fixed_content  # Body's own local reassignment untouched.
@@ -1929,7 +1906,9 @@ def test_autofix_follows_closure_into_generic_functions_own_annotation_despite_b
     assert inner.__annotations__ == {"value": "runtime value"}
 
 
-def test_autofix_does_not_rename_generic_functions_own_annotation_referencing_a_peer_type_parameter() -> None:
+def test_autofix_does_not_rename_generic_functions_own_annotation_referencing_a_peer_type_parameter(
+    tmp_path: Path,
+) -> None:
     # Companion to the test above: an annotation referencing a *peer* type
     # parameter (rather than an enclosing-scope name) must still be left
     # alone, exactly like a type parameter's own bound/default already is —
@@ -1944,16 +1923,15 @@ def test_autofix_does_not_rename_generic_functions_own_annotation_referencing_a_
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "def inner[data](value: data) -> data:" in fixed_content
     module_namespace: dict[str, Any] = {}
@@ -1971,7 +1949,7 @@ def test_autofix_does_not_rename_generic_functions_own_annotation_referencing_a_
     assert inner.__annotations__ == {"value": peer_type_var, "return": peer_type_var}
 
 
-def test_autofix_does_not_follow_generic_functions_own_annotation_under_deferred_annotations() -> None:
+def test_autofix_does_not_follow_generic_functions_own_annotation_under_deferred_annotations(tmp_path: Path) -> None:
     # Branch coverage: a generic function's annotation must still be
     # excluded entirely under `from __future__ import annotations`, exactly
     # like a non-generic function's — deferred annotations turn every
@@ -1988,21 +1966,20 @@ def outer(response):
 
     return inner
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "def inner[T](value: data):" in fixed_content
 
 
-def test_scope_names_ignore_unnamed_except_and_match_captures() -> None:
+def test_scope_names_ignore_unnamed_except_and_match_captures(tmp_path: Path) -> None:
     # Branch coverage: a bare `except:` or wildcard `case _:` produces an
     # ExceptHandler/MatchAs node with `name=None` — `_get_scope_names()`
     # must not treat that as introducing a bound name.
@@ -2017,22 +1994,21 @@ def test_scope_names_ignore_unnamed_except_and_match_captures() -> None:
             pass
     return data
 """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert check.fix(filepath, violations, source, tree) is True
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     ast.parse(fixed_content)
 
 
-def test_autofix_replaces_all_uses_in_scope() -> None:
+def test_autofix_replaces_all_uses_in_scope(tmp_path: Path) -> None:
     source = """import requests
 
 def fetch_users():
@@ -2042,24 +2018,23 @@ def fetch_users():
     return result
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        check.fix(filepath, violations, source, tree)
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    check.fix(filepath, violations, source, tree)
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
-        assert "data" not in fixed_content
-        assert "result = response.json()" in fixed_content
-        assert ".json()" in fixed_content
-        assert "print(" in fixed_content
+    assert "data" not in fixed_content
+    assert "result = response.json()" in fixed_content
+    assert ".json()" in fixed_content
+    assert "print(" in fixed_content
 
 
-def test_autofix_avoids_walrus_target_collision_in_comprehension() -> None:
+def test_autofix_avoids_walrus_target_collision_in_comprehension(tmp_path: Path) -> None:
     # A suggested name must not collide with a `:=` target bound inside a
     # comprehension in the same scope (PEP 572: the walrus target belongs
     # to the enclosing scope, not the comprehension's own scope), even
@@ -2072,22 +2047,21 @@ def test_autofix_avoids_walrus_target_collision_in_comprehension() -> None:
         "    return data, items\n"
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        check.fix(filepath, violations, source, tree)
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    check.fix(filepath, violations, source, tree)
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "response = requests.get(url)" not in fixed_content
     assert "response := check(x)" in fixed_content
 
 
-def test_scope_isolation() -> None:
+def test_scope_isolation(tmp_path: Path) -> None:
     source = """def func1():
     data: FirstPayload = get_first_payload()
     return data
@@ -2097,22 +2071,21 @@ def func2():
     return data
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert len(violations) == 2
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert len(violations) == 2
 
-        check.fix(filepath, violations, source, tree)
-        fixed_content = filepath.read_text()
+    check.fix(filepath, violations, source, tree)
+    fixed_content = filepath.read_text()
 
-        assert "first_payload: FirstPayload = get_first_payload()" in fixed_content
-        assert "second_payload: SecondPayload = get_second_payload()" in fixed_content
-        assert "def func1():" in fixed_content
-        assert "def func2():" in fixed_content
+    assert "first_payload: FirstPayload = get_first_payload()" in fixed_content
+    assert "second_payload: SecondPayload = get_second_payload()" in fixed_content
+    assert "def func1():" in fixed_content
+    assert "def func2():" in fixed_content
 
 
 def test_scope_replacement_helpers_skip_class_bodies_and_support_modules() -> None:
@@ -2127,7 +2100,7 @@ def test_scope_replacement_helpers_skip_class_bodies_and_support_modules() -> No
     ) == [(1, 0, "data", "payload")]
 
 
-def test_repeated_binding_leaves_the_file_unchanged() -> None:
+def test_repeated_binding_leaves_the_file_unchanged(tmp_path: Path) -> None:
     source = """def process():
     data: Payload = get_payload()
     print(data)
@@ -2135,23 +2108,22 @@ def test_repeated_binding_leaves_the_file_unchanged() -> None:
     print(data)
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert len(violations) == 2
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert len(violations) == 2
 
-        check.fix(filepath, violations, source, tree)
+    check.fix(filepath, violations, source, tree)
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert fixed_content == source
 
 
-def test_autofix_replaces_name_on_line_with_non_ascii_text() -> None:
+def test_autofix_replaces_name_on_line_with_non_ascii_text(tmp_path: Path) -> None:
     # Regression: ast.col_offset is a UTF-8 byte offset, not a character
     # offset. Non-ASCII text earlier on the same line as the forbidden
     # name must not throw off the position used to locate and replace it.
@@ -2162,18 +2134,17 @@ def process():
     return data.status_code
 """
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "test.py"
-        filepath.write_text(source)
+    filepath = tmp_path / "test.py"
+    filepath.write_text(source)
 
-        tree = ast.parse(source)
-        check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
-        violations = check.check(filepath, tree, source)
-        assert len(violations) == 1
+    tree = ast.parse(source)
+    check = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE)
+    violations = check.check(filepath, tree, source)
+    assert len(violations) == 1
 
-        assert check.fix(filepath, violations, source, tree) is True
+    assert check.fix(filepath, violations, source, tree) is True
 
-        fixed_content = filepath.read_text()
+    fixed_content = filepath.read_text()
 
     assert "data" not in fixed_content
     assert "response = requests.get(url)" in fixed_content
@@ -2243,9 +2214,9 @@ def test_default_level_is_conservative() -> None:
 """
     tree = ast.parse(source)
 
-    assert ForbidVarsCheck().check(Path("test.py"), tree, source) == ForbidVarsCheck(
+    assert ForbidVarsCheck().check(_FAKE_PATH, tree, source) == ForbidVarsCheck(
         level=ForbidVarsLevel.CONSERVATIVE
-    ).check(Path("test.py"), tree, source)
+    ).check(_FAKE_PATH, tree, source)
 
 
 @pytest.mark.parametrize(
@@ -2273,8 +2244,8 @@ def fetch_users():
 def test_conservative_level_gates_on_suggestion_presence(source: str, conservative_count: int) -> None:
     tree = ast.parse(source)
 
-    conservative = ForbidVarsCheck().check(Path("test.py"), tree, source)
-    permissive = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(Path("test.py"), tree, source)
+    conservative = ForbidVarsCheck().check(_FAKE_PATH, tree, source)
+    permissive = ForbidVarsCheck(level=ForbidVarsLevel.PERMISSIVE).check(_FAKE_PATH, tree, source)
 
     assert len(conservative) == conservative_count
     assert len(permissive) == 1
@@ -9,6 +9,7 @@ from pre_commit_hooks.ast_checks._base import is_fix_failed
 from pre_commit_hooks.ast_checks.misplaced_comment import MisplacedCommentCheck
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "misplaced_comments"
+_FAKE_PATH = Path("test.py")
 
 
 def test_check_id_and_error_code() -> None:
@@ -31,7 +32,7 @@ def test_prefilter_pattern_is_hash() -> None:
     ids=["closing-paren", "dedups-multiple-closing-brackets"],
 )
 def test_check_detects_trailing_comment(source: str, line: int, *, fixable: bool) -> None:
-    violations = MisplacedCommentCheck().check(Path("test.py"), ast.parse(source), source)
+    violations = MisplacedCommentCheck().check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 1
     assert violations[0].error_code == "STYLE-001"
@@ -50,7 +51,7 @@ def test_check_detects_trailing_comment(source: str, line: int, *, fixable: bool
     ids=["correctly-placed", "inline-ignore", "tokens-between-bracket-and-comment"],
 )
 def test_check_returns_no_violations(source: str) -> None:
-    assert MisplacedCommentCheck().check(Path("test.py"), ast.parse(source), source) == []
+    assert MisplacedCommentCheck().check(_FAKE_PATH, ast.parse(source), source) == []
 
 
 @pytest.mark.parametrize(
@@ -214,7 +215,7 @@ def test_fixes_match_golden_fixtures(fixture_name: str, tmp_path: Path) -> None:
 def test_correctly_placed_comments_not_flagged(fixture_name: str) -> None:
     source = (FIXTURES_DIR / "good" / f"{fixture_name}.py").read_text()
 
-    assert MisplacedCommentCheck().check(Path("test.py"), ast.parse(source), source) == []
+    assert MisplacedCommentCheck().check(_FAKE_PATH, ast.parse(source), source) == []
 
 
 def test_preserves_linter_pragma_comments(tmp_path: Path) -> None:
@@ -8,10 +8,11 @@ import pytest
 from pre_commit_hooks.ast_checks.redundant_super_init import RedundantSuperInitCheck
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "redundant_super_init"
+_FAKE_PATH = Path("test.py")
 
 
 def _check(source: str) -> list[str]:
-    violations = RedundantSuperInitCheck().check(Path("test.py"), ast.parse(source), source)
+    violations = RedundantSuperInitCheck().check(_FAKE_PATH, ast.parse(source), source)
     return [v.message for v in violations]
 
 
@@ -56,8 +57,8 @@ def test_fix_always_returns_false() -> None:
     source = "class Foo:\n    pass\n"
     tree = ast.parse(source)
     check = RedundantSuperInitCheck()
-    violations = check.check(Path("test.py"), tree, source)
-    assert check.fix(Path("test.py"), violations, source, tree, "utf-8") is False
+    violations = check.check(_FAKE_PATH, tree, source)
+    assert check.fix(_FAKE_PATH, violations, source, tree, "utf-8") is False
 
 
 def test_violation_has_expected_line_and_no_fixable() -> None:
@@ -70,7 +71,7 @@ class Child(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 """
-    violations = RedundantSuperInitCheck().check(Path("test.py"), ast.parse(source), source)
+    violations = RedundantSuperInitCheck().check(_FAKE_PATH, ast.parse(source), source)
 
     assert len(violations) == 1
     violation = violations[0]
@@ -11,6 +11,7 @@ from pre_commit_hooks.ast_checks.validate_function_name.analysis import (
     _get_base_name,
     analyze_function,
     attach_parents,
+    collect_suggestions,
     decorator_name,
     derive_entity_from_name,
     extract_first_verb,
@@ -24,7 +25,14 @@ from pre_commit_hooks.ast_checks.validate_function_name.analysis import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pre_commit_hooks.ast_checks.validate_function_name.analysis import Suggestion
+
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "validate_function_name"
+_FAKE_PATH = Path("source.py")
+
+
+def _suggestions(source: str) -> list[Suggestion]:
+    return collect_suggestions(_FAKE_PATH, ast.parse(source), source)
 
 
 def _func(source: str, name: str) -> ast.FunctionDef | ast.AsyncFunctionDef:
@@ -359,7 +367,7 @@ def test_analyze_function_flags(source: str, func_name: str, flags: dict[str, bo
         assert analysis[flag] is expected, flag
 
 
-def test_process_file_with_get_or_create_cache_pattern(tmp_path: Path) -> None:
+def test_get_or_create_cache_pattern_is_not_suggested_update() -> None:
     source = """
 _cache = {}
 
@@ -370,16 +378,13 @@ def get_or_create_item(key):
     return _cache[key]
 """
 
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    for suggestion in process_file(filepath):
+    for suggestion in _suggestions(source):
         assert not suggestion.suggested_name.startswith("update_"), (
             f"Should not suggest update_ for cache pattern, got: {suggestion.suggested_name}"
         )
 
 
-def test_get_function_returning_class_is_not_flagged(tmp_path: Path) -> None:
+def test_get_function_returning_class_is_not_flagged() -> None:
     source = """
 def get_placeholder_backend(original_exception):
     '''Create a placeholder backend class.'''
@@ -389,13 +394,10 @@ def get_placeholder_backend(original_exception):
     return PlaceholderBackend
 """
 
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
+    assert _suggestions(source) == [], "Functions returning classes should keep get_ prefix"
 
-    assert process_file(filepath) == [], "Functions returning classes should keep get_ prefix"
 
-
-def test_docstring_verb_combine_detected(tmp_path: Path) -> None:
+def test_docstring_verb_combine_detected() -> None:
     source = """
 def get_combined_revision(*functions):
     '''Combine the parameters of all revisions into a single revision.'''
@@ -405,17 +407,14 @@ def get_combined_revision(*functions):
     return params
 """
 
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    suggestions = process_file(filepath)
+    suggestions = _suggestions(source)
 
     assert len(suggestions) == 1
     assert suggestions[0].suggested_name == "combine_combined_revision"
     assert "combine" in suggestions[0].reason.lower()
 
 
-def test_mock_creation_suggests_create(tmp_path: Path) -> None:
+def test_mock_creation_suggests_create() -> None:
     source = """
 from unittest.mock import MagicMock
 
@@ -426,17 +425,14 @@ def get_mock_response(**kwargs):
     return MagicMock(spec=object, **response_kwargs)
 """
 
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    suggestions = process_file(filepath)
+    suggestions = _suggestions(source)
 
     assert len(suggestions) == 1
     assert suggestions[0].suggested_name == "create_mock_response"
     assert "mock" in suggestions[0].reason.lower()
 
 
-def test_async_get_function_is_flagged(tmp_path: Path) -> None:
+def test_async_get_function_is_flagged() -> None:
     # Async get_* functions must be flagged, not just sync ones.
     source = """
 import requests
@@ -447,10 +443,7 @@ class Fetcher:
         return requests.get(url).json()
 """
 
-    filepath = tmp_path / "source.py"
-    filepath.write_text(source)
-
-    suggestions = process_file(filepath)
+    suggestions = _suggestions(source)
 
     assert len(suggestions) == 1
     assert suggestions[0].func_name == "get_api_data"